@@ -0,0 +1,51 @@
+"""Measure `import fast_depends` with `python -X importtime`.
+
+Fails if the import pulls a module which should be loaded only on demand.
+
+Usage: python -m benchmarks.import_time
+"""
+
+import subprocess
+import sys
+
+REPEAT = 5
+
+# loaded by the first model build or the first async call
+DEFERRED = ("pydantic", "msgspec", "anyio", "asyncio")
+
+
+def import_time() -> tuple[int, set[str]]:
+    """Cumulative import time in microseconds and all imported modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import fast_depends"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    total, modules = 0, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            # header line
+            continue
+        modules.add(name.strip())
+        if name.strip() == "fast_depends":
+            total = int(cumulative)
+    return total, modules
+
+
+def main() -> None:
+    results = [import_time() for _ in range(REPEAT)]
+    best = min(total for total, _ in results)
+    print(f"import fast_depends: {best / 1000:.1f}ms")  # noqa: T201
+
+    loaded = sorted(m for m in DEFERRED if m in results[0][1])
+    if loaded:
+        sys.exit(f"eagerly imported: {', '.join(loaded)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Compare `PydanticSerializer` arguments extraction with the `getattr` loop.
+
+Usage: python -m benchmarks.serializer_fields
+"""
+
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from fast_depends.library.serializer import OptionItem, Serializer
+from fast_depends.pydantic import PydanticSerializer
+from fast_depends.pydantic._compat import get_model_fields
+
+NUMBER = 5_000
+REPEAT = 5
+
+
+def getattr_path(serializer: Any, call_kwargs: dict[str, Any]) -> dict[str, Any]:
+    # the path used before validated values were taken from the model `__dict__`
+    casted_model = serializer.model(**call_kwargs)
+    return {i: getattr(casted_model, i) for i in get_model_fields(casted_model).keys()}
+
+
+def measure(
+    path: Callable[[Any, dict[str, Any]], Any],
+    serializer: Serializer,
+    call_kwargs: dict[str, Any],
+) -> float:
+    """Best time of a single call in microseconds."""
+    timer = timeit.Timer(lambda: path(serializer, call_kwargs))
+    return min(timer.repeat(number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def serializer_path(
+    serializer: Serializer, call_kwargs: dict[str, Any]
+) -> dict[str, Any]:
+    return serializer(call_kwargs)
+
+
+def main() -> None:
+    for params in (5, 20, 100):
+        serializer = PydanticSerializer(use_fastdepends_errors=False)(
+            name=f"Model{params}",
+            options=[
+                OptionItem(field_name=f"a{i}", field_type=int) for i in range(params)
+            ],
+            response_type=None,
+        )
+        call_kwargs = {f"a{i}": str(i) for i in range(params)}
+        assert serializer(call_kwargs) == getattr_path(serializer, call_kwargs)
+
+        before = measure(getattr_path, serializer, call_kwargs)
+        after = measure(serializer_path, serializer, call_kwargs)
+        print(  # noqa: T201
+            f"{params:>3} params: getattr {before:.2f}us, "
+            f"validator {after:.2f}us ({before / after:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
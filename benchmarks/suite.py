@@ -0,0 +1,345 @@
+"""Dependency resolution benchmarks over synthetic dependency graphs.
+
+Every case is measured for each available serializer (none, pydantic, msgspec)
+and for sync and async calls. The results are written to a JSON file to compare
+fast_depends versions or environments.
+
+Usage: python -m benchmarks.suite [--output results.json] [--filter chain]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+from dataclasses import asdict, dataclass, field
+from importlib.metadata import PackageNotFoundError, version
+from inspect import Parameter, Signature
+from typing import Any
+
+import anyio
+
+from fast_depends import Depends, Provider, inject
+from fast_depends.library import CustomField
+from fast_depends.library.serializer import SerializerProto
+
+NUMBER = 2_000
+REPEAT = 5
+
+DEPTHS = (1, 5, 10)
+FAN_OUTS = (1, 10, 50)
+
+
+@dataclass
+class Case:
+    name: str
+    params: dict[str, Any]
+    # returns the function to inject and the keyword arguments to call it with
+    factory: Callable[[bool], tuple[Callable[..., Any], dict[str, Any]]]
+
+
+@dataclass
+class Result:
+    case: str
+    params: dict[str, Any]
+    serializer: str
+    mode: str
+    us_per_call: float
+    number: int
+    repeat: int
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+def make_function(
+    body: Callable[..., Any],
+    params: dict[str, Any],
+    *,
+    is_async: bool,
+) -> Callable[..., Any]:
+    """Make a function with `params` defaults as `int` keyword parameters."""
+    if is_async:
+
+        async def func(**kwargs: Any) -> int:
+            return body(**kwargs)  # type: ignore[no-any-return]
+
+    else:
+
+        def func(**kwargs: Any) -> int:
+            return body(**kwargs)  # type: ignore[no-any-return]
+
+    func.__signature__ = Signature(  # type: ignore[attr-defined]
+        [
+            Parameter(name, Parameter.KEYWORD_ONLY, default=default, annotation=int)
+            for name, default in params.items()
+        ],
+        return_annotation=int,
+    )
+    return func
+
+
+def leaf(is_async: bool) -> Callable[..., Any]:
+    return make_function(lambda: 1, {}, is_async=is_async)
+
+
+def chain(depth: int, is_async: bool) -> tuple[Callable[..., Any], dict[str, Any]]:
+    """`root -> dep -> ... -> leaf` of `depth` dependencies."""
+    dep = leaf(is_async)
+    for _ in range(depth - 1):
+        dep = make_function(lambda x: x + 1, {"x": Depends(dep)}, is_async=is_async)
+    return make_function(lambda x: x, {"x": Depends(dep)}, is_async=is_async), {}
+
+
+def fan_out(width: int, is_async: bool) -> tuple[Callable[..., Any], dict[str, Any]]:
+    """`root` with `width` independent dependencies."""
+    params = {f"d{i}": Depends(leaf(is_async)) for i in range(width)}
+    return make_function(lambda **kw: sum(kw.values()), params, is_async=is_async), {}
+
+
+def shared(
+    width: int, use_cache: bool, is_async: bool
+) -> tuple[Callable[..., Any], dict[str, Any]]:
+    """`root` with `width` dependencies on the same leaf."""
+    common = leaf(is_async)
+    params = {
+        f"d{i}": Depends(
+            make_function(
+                lambda x: x,
+                {"x": Depends(common, use_cache=use_cache)},
+                is_async=is_async,
+            )
+        )
+        for i in range(width)
+    }
+    return make_function(lambda **kw: sum(kw.values()), params, is_async=is_async), {}
+
+
+def make_generator(is_async: bool) -> Callable[..., Any]:
+    if is_async:
+
+        async def gen() -> AsyncGenerator[int, None]:
+            yield 1
+
+    else:
+
+        def gen() -> Generator[int, None, None]:  # type: ignore[misc]
+            yield 1
+
+    return gen
+
+
+def generators(width: int, is_async: bool) -> tuple[Callable[..., Any], dict[str, Any]]:
+    """`root` with `width` generator dependencies."""
+    # a new callable for each to not share the cached value
+    params = {f"d{i}": Depends(make_generator(is_async)) for i in range(width)}
+    return make_function(lambda **kw: sum(kw.values()), params, is_async=is_async), {}
+
+
+class Header(CustomField):
+    def use(self, /, **kwargs: Any) -> dict[str, Any]:
+        kwargs = super().use(**kwargs)
+        if (value := kwargs["headers"].get(self.param_name)) is not None:
+            kwargs[self.param_name] = value
+        return kwargs
+
+
+def custom_fields(
+    width: int, is_async: bool
+) -> tuple[Callable[..., Any], dict[str, Any]]:
+    """`root` with `width` header fields."""
+    params = {f"h{i}": Header() for i in range(width)}
+    headers = {f"h{i}": str(i) for i in range(width)}
+    return (
+        make_function(lambda **kw: len(kw), params, is_async=is_async),
+        {"headers": headers},
+    )
+
+
+def cases() -> Iterator[Case]:
+    for depth in DEPTHS:
+        yield Case(
+            "chain",
+            {"depth": depth},
+            lambda is_async, depth=depth: chain(depth, is_async),
+        )
+
+    for width in FAN_OUTS:
+        yield Case(
+            "fan_out",
+            {"width": width},
+            lambda is_async, width=width: fan_out(width, is_async),
+        )
+
+        for use_cache in (True, False):
+            yield Case(
+                "shared",
+                {"width": width, "use_cache": use_cache},
+                lambda is_async, width=width, use_cache=use_cache: shared(
+                    width, use_cache, is_async
+                ),
+            )
+
+        yield Case(
+            "generators",
+            {"width": width},
+            lambda is_async, width=width: generators(width, is_async),
+        )
+
+        yield Case(
+            "custom_fields",
+            {"width": width},
+            lambda is_async, width=width: custom_fields(width, is_async),
+        )
+
+
+def serializers() -> dict[str, SerializerProto | None]:
+    available: dict[str, SerializerProto | None] = {"none": None}
+
+    try:
+        from fast_depends.pydantic import PydanticSerializer
+    except ImportError:
+        pass
+    else:
+        available["pydantic"] = PydanticSerializer()
+
+    try:
+        from fast_depends.msgspec import MsgSpecSerializer
+    except ImportError:
+        pass
+    else:
+        available["msgspec"] = MsgSpecSerializer()
+
+    return available
+
+
+def measure_sync(
+    func: Callable[..., Any],
+    kwargs: dict[str, Any],
+    number: int,
+    repeat: int,
+) -> float:
+    """Best time of a single call in microseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(**kwargs)
+        timings.append(time.perf_counter() - start)
+    return min(timings) / number * 1e6
+
+
+def measure_async(
+    func: Callable[..., Any],
+    kwargs: dict[str, Any],
+    number: int,
+    repeat: int,
+) -> float:
+    """Best time of a single call in microseconds, the event loop start excluded."""
+
+    async def run() -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                await func(**kwargs)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    return anyio.run(run) / number * 1e6
+
+
+def run_case(
+    case: Case,
+    serializer_name: str,
+    serializer_cls: SerializerProto | None,
+    is_async: bool,
+    *,
+    number: int,
+    repeat: int,
+) -> Result:
+    call, kwargs = case.factory(is_async)
+
+    build_start = time.perf_counter()
+    func = inject(
+        call,
+        dependency_provider=Provider(),
+        serializer_cls=serializer_cls,
+    )
+    build_time = (time.perf_counter() - build_start) * 1e6
+
+    measure = measure_async if is_async else measure_sync
+    return Result(
+        case=case.name,
+        params=case.params,
+        serializer=serializer_name,
+        mode="async" if is_async else "sync",
+        us_per_call=round(measure(func, kwargs, number, repeat), 3),
+        number=number,
+        repeat=repeat,
+        extra={"build_us": round(build_time, 1)},
+    )
+
+
+def environment() -> dict[str, Any]:
+    def package_version(name: str) -> str | None:
+        try:
+            return version(name)
+        except PackageNotFoundError:
+            return None
+
+    return {
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "packages": {
+            name: package_version(name)
+            for name in ("fast_depends", "pydantic", "msgspec", "anyio")
+        },
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--filter", help="run only cases with the name containing it")
+    parser.add_argument("--number", type=int, default=NUMBER, help="calls per repeat")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    args = parser.parse_args()
+
+    results: list[Result] = []
+    for case in cases():
+        if args.filter and args.filter not in case.name:
+            continue
+
+        for serializer_name, serializer_cls in serializers().items():
+            for is_async in (False, True):
+                result = run_case(
+                    case,
+                    serializer_name,
+                    serializer_cls,
+                    is_async,
+                    number=args.number,
+                    repeat=args.repeat,
+                )
+                results.append(result)
+                print(  # noqa: T201
+                    f"{result.case:<14} {json.dumps(result.params):<34} "
+                    f"{result.serializer:<9} {result.mode:<6} "
+                    f"{result.us_per_call:>10.2f}us"
+                )
+
+    with open(args.output, "w") as f:
+        json.dump(
+            {
+                "environment": environment(),
+                "results": [asdict(i) for i in results],
+            },
+            f,
+            indent=2,
+        )
+    print(f"results are saved to {args.output}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
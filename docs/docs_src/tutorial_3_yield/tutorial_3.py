@@ -0,0 +1,18 @@
+from fast_depends import Depends, dependency_provider, inject
+
+
+async def dependency():
+    pool = await create_pool()
+    try:
+        yield pool
+    finally:
+        await pool.close()
+
+
+@inject
+async def main(pool = Depends(dependency, scope="app")):
+    ...
+
+
+# close the pool at your application shutdown
+await dependency_provider.aclose()
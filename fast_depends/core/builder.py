@@ -1,15 +1,17 @@
 import inspect
-from collections.abc import Callable, Sequence
-from copy import deepcopy
+from collections.abc import Callable, Hashable, Sequence
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Annotated,
     Any,
     Optional,
     TypeVar,
+    Union,
     get_args,
     get_origin,
 )
+from weakref import WeakValueDictionary
 
 from typing_extensions import (
     ParamSpec,
@@ -17,7 +19,12 @@ from typing_extensions import (
 
 from fast_depends.dependencies.model import Dependant
 from fast_depends.library import CustomField
-from fast_depends.library.serializer import OptionItem, Serializer, SerializerProto
+from fast_depends.library.serializer import (
+    LazySerializer,
+    OptionItem,
+    Serializer,
+    SerializerProto,
+)
 from fast_depends.utils import (
     get_typed_signature,
     is_async_gen_callable,
@@ -28,7 +35,10 @@ from fast_depends.utils import (
 from .model import CallModel
 
 if TYPE_CHECKING:
+    from fast_depends.dependencies.memo import Memoize
+    from fast_depends.dependencies.model import Execution, Scope
     from fast_depends.dependencies.provider import Key, Provider
+    from fast_depends.utils import ThreadPool
 
 
 CUSTOM_ANNOTATIONS = (
@@ -50,6 +60,14 @@ def build_call_model(
     extra_dependencies: Sequence[Dependant] = (),
     serializer_cls: Optional["SerializerProto"] = None,
     serialize_result: bool = True,
+    concurrent: bool = False,
+    scope: "Scope" = "call",
+    memoize: Optional["Memoize"] = None,
+    coalesce: bool = False,
+    execution: "Execution" = "default",
+    thread_pool: Union[str, "ThreadPool", None] = None,
+    stream_batch_size: int | None = None,
+    lazy_serializer: bool = False,
 ) -> CallModel:
     if hasattr(call, "_fastdepends_call_") and not hasattr(call, "_mock_name"):
         call = call._fastdepends_call_
@@ -73,6 +91,13 @@ def build_call_model(
     if not serialize_result:
         return_annotation = inspect.Parameter.empty
 
+    assert not (memoize and is_call_generator), (
+        f"You cannot memoize generator dependency `{name}`"
+    )
+    assert not (coalesce and is_call_generator), (
+        f"You cannot coalesce generator dependency `{name}`"
+    )
+
     class_fields: list[OptionItem] = []
     dependencies: dict[str, Key] = {}
     custom_fields: dict[str, CustomField] = {}
@@ -109,7 +134,7 @@ def build_call_model(
                 if isinstance(next_custom, Dependant):
                     dep = next_custom
                 elif isinstance(next_custom, CustomField):
-                    custom = deepcopy(next_custom)
+                    custom = next_custom.clone()
                 else:  # pragma: no cover
                     raise AssertionError("unreachable")
 
@@ -153,13 +178,16 @@ def build_call_model(
             )
 
         if dep:
-            dependency = build_call_model(
-                dep.dependency,
+            dependency = _build_dependency(
+                dep,
                 dependency_provider=dependency_provider,
-                use_cache=dep.use_cache,
                 is_sync=is_sync,
                 serializer_cls=serializer_cls,
                 serialize_result=dep.cast_result,
+                concurrent=concurrent,
+                execution=execution,
+                thread_pool=thread_pool,
+                lazy_serializer=lazy_serializer,
             )
 
             key = dependency_provider.add_dependant(dependency)
@@ -169,6 +197,7 @@ def build_call_model(
                 dependency=dependency,
                 key=key,
                 serializer_cls=serializer_cls,
+                concurrent=concurrent,
             )
 
             overrided_dependency = dependency_provider.get_dependant(key)
@@ -243,8 +272,23 @@ def build_call_model(
                 positional_args.append(param_name)
 
     serializer: Serializer | None = None
-    if serializer_cls is not None:
-        serializer = serializer_cls(
+    if serializer_cls is not None and lazy_serializer:
+        serializer = LazySerializer(
+            partial(
+                _build_serializer,
+                serializer_cls,
+                name=name,
+                options=class_fields,
+                response_type=return_annotation,
+            ),
+            name=name,
+            options=class_fields,
+            response_type=return_annotation,
+        )
+
+    elif serializer_cls is not None:
+        serializer = _build_serializer(
+            serializer_cls,
             name=name,
             options=class_fields,
             response_type=return_annotation,
@@ -252,12 +296,16 @@ def build_call_model(
 
     solved_extra_dependencies: list[Key] = []
     for dep in extra_dependencies:
-        dependency = build_call_model(
-            dep.dependency,
+        dependency = _build_dependency(
+            dep,
             dependency_provider=dependency_provider,
-            use_cache=dep.use_cache,
             is_sync=is_sync,
             serializer_cls=serializer_cls,
+            serialize_result=True,
+            concurrent=concurrent,
+            execution=execution,
+            thread_pool=thread_pool,
+            lazy_serializer=lazy_serializer,
         )
 
         key = dependency_provider.add_dependant(dependency)
@@ -290,16 +338,184 @@ def build_call_model(
         extra_dependencies=solved_extra_dependencies,
         dependency_provider=dependency_provider,
         serializer_cls=serializer_cls,
+        concurrent=concurrent,
+        scope=scope,
+        memoize=memoize,
+        coalesce=coalesce,
+        execution=execution,
+        thread_pool=thread_pool,
+        stream_batch_size=stream_batch_size,
+    )
+
+
+def _build_dependency(
+    dep: Dependant,
+    *,
+    dependency_provider: "Provider",
+    is_sync: bool,
+    serializer_cls: Optional["SerializerProto"],
+    serialize_result: bool,
+    concurrent: bool,
+    execution: "Execution",
+    thread_pool: Union[str, "ThreadPool", None],
+    lazy_serializer: bool,
+) -> CallModel:
+    """Build the dependency model or reuse the one built with the same options.
+
+    Cached models are stored with the subtree they registered at the provider, so a
+    cache hit registers the same models a fresh build would.
+    """
+    execution = _resolve_execution(dep, execution)
+    thread_pool = dep.thread_pool or thread_pool
+
+    key: Hashable | None = (
+        dep.dependency,
+        dep.use_cache,
+        is_sync,
+        serializer_cls,
+        serialize_result,
+        concurrent,
+        dep.scope,
+        dep.memoize,
+        dep.coalesce,
+        execution,
+        thread_pool,
+        lazy_serializer,
+    )
+    build_cache = dependency_provider.build_cache
+    try:
+        cached = build_cache.get(key)
+    except TypeError:
+        # unhashable callable or option
+        cached, key = None, None
+
+    if cached is not None:
+        model, registered = cached
+        for _, sub_model in registered:
+            dependency_provider.add_dependant(sub_model)
+        return model
+
+    model = build_call_model(
+        dep.dependency,
+        dependency_provider=dependency_provider,
+        use_cache=dep.use_cache,
+        is_sync=is_sync,
+        serializer_cls=serializer_cls,
+        serialize_result=serialize_result,
+        concurrent=concurrent,
+        scope=dep.scope,
+        memoize=dep.memoize,
+        coalesce=dep.coalesce,
+        execution=execution,
+        thread_pool=thread_pool,
+        lazy_serializer=lazy_serializer,
     )
 
+    if key is not None:
+        build_cache[key] = (model, _registered_subtree(dependency_provider, model))
+    return model
+
+
+def _registered_subtree(
+    dependency_provider: "Provider",
+    model: CallModel,
+) -> list[tuple["Key", CallModel]]:
+    registered: dict[Key, CallModel] = {}
+    keys = [*model.dependencies.values(), *model.extra_dependencies]
+    while keys:
+        key = keys.pop()
+        if key in registered:
+            continue
+        registered[key] = sub_model = dependency_provider.dependencies[key]
+        keys.extend(sub_model.dependencies.values())
+        keys.extend(sub_model.extra_dependencies)
+    return list(registered.items())
+
+
+def _resolve_execution(dep: Dependant, default: "Execution") -> "Execution":
+    """Dependency own policy takes precedence over the inherited one"""
+    if dep.execution == "default":
+        return default
+    return dep.execution
+
 
 def _rebuild_override_model(
     dependency_provider: "Provider",
     dependency: CallModel,
     key: "Key",
     serializer_cls: Optional["SerializerProto"],
+    concurrent: bool,
 ) -> None:
-    """Rebuild override model in case of a different serializer class"""
+    """Rebuild override model in case of a different serializer class or concurrency"""
     override_model = dependency_provider.overrides.get(key)
-    if override_model is not None and override_model.serializer_cls != serializer_cls:
+    if override_model is not None and (
+        override_model.serializer_cls != serializer_cls
+        or override_model.concurrent != concurrent
+    ):
         dependency_provider.override(dependency.call, override_model.call)
+
+
+# structurally equal serializers share their models between all call sites
+# and providers, each call site gets a copy named after it
+_serializers: "WeakValueDictionary[Hashable, Serializer]" = WeakValueDictionary()
+
+
+def _build_serializer(
+    serializer_cls: "SerializerProto",
+    *,
+    name: str,
+    options: list[OptionItem],
+    response_type: Any,
+) -> Serializer:
+    key = _serializer_key(serializer_cls, options, response_type)
+    if key is None:
+        return serializer_cls(name=name, options=options, response_type=response_type)
+
+    if (serializer := _serializers.get(key)) is None:
+        serializer = serializer_cls(
+            name=name,
+            options=options,
+            response_type=response_type,
+        )
+        try:
+            _serializers[key] = serializer
+        except TypeError:
+            # the serializer does not support weak references
+            pass
+
+    elif serializer.name != name:
+        serializer = serializer.with_name(name)
+
+    return serializer
+
+
+def _serializer_key(
+    serializer_cls: "SerializerProto",
+    options: list[OptionItem],
+    response_type: Any,
+) -> Hashable | None:
+    """Key the serializer by everything it is built from except the call name.
+
+    Default types are a part of the key to not mix up equal values like `1` and `True`,
+    sources are compared by the way they are shown in validation errors.
+    """
+    key = (
+        serializer_cls,
+        response_type,
+        tuple(
+            (
+                i.field_name,
+                i.field_type,
+                type(i.default_value),
+                i.default_value,
+                i.kind,
+                None if i.source is None else str(i.source),
+            )
+            for i in options
+        ),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
@@ -0,0 +1,134 @@
+from collections.abc import Callable
+from contextlib import AsyncExitStack, ExitStack
+from typing import Any
+
+from fast_depends.utils import is_coroutine_callable
+
+from .model import CallModel
+
+__all__ = ("generate_injected_wrapper",)
+
+
+def generate_injected_wrapper(
+    model: CallModel,
+    call_extra: dict[str, Any],
+) -> Callable[..., Any] | None:
+    """Generate a wrapper with argument binding unrolled for the model signature.
+
+    Works the same way as `CallModel.solve` / `CallModel.asolve` called with a
+    fresh cache and stack, but does not interpret the binding plan on each call.
+    Returns `None` if the model shape is not supported, so the caller should
+    fall back to the regular wrapper.
+    """
+    if (
+        model.is_generator
+        or model.concurrent
+        or model.custom_fields
+        or model.args_name
+        or model.kwargs_name
+    ):
+        return None
+
+    namespace: dict[str, Any] = {
+        "_model": model,
+        "_call": model.call,
+        "_call_extra": call_extra,
+        "_serializer": model.serializer,
+        "ExitStack": ExitStack,
+        "AsyncExitStack": AsyncExitStack,
+    }
+
+    if not model.is_async:
+        solve, call = "{}.solve", "_call(**call_kwargs)"
+    elif is_coroutine_callable(model.call):
+        solve, call = "await {}.asolve", "await _call(**call_kwargs)"
+    else:
+        solve, call = "await {}.asolve", "await _model._run_async(_call, **call_kwargs)"
+
+    lines = [
+        "async def injected_wrapper(*args, **kwargs):"
+        if model.is_async
+        else "def injected_wrapper(*args, **kwargs):"
+    ]
+
+    if call_extra:
+        lines.append("kwargs = _call_extra | kwargs")
+
+    lines.append("kw = {}")
+    lines.extend(
+        f"if {arg!r} in kwargs: kw[{arg!r}] = kwargs.pop({arg!r})"
+        for arg in model.keyword_args
+    )
+    lines.extend(("kw.update(kwargs)", "consumed, args_count = 0, len(args)"))
+    # positional arguments left unbound after the first pass mean `args` are exhausted
+    keyword_only_args = (
+        arg for arg in model._bind_positional_args if arg not in model.positional_args
+    )
+    for arg in (*model.positional_args, *keyword_only_args):
+        lines.extend(
+            (
+                f"if consumed < args_count and {arg!r} not in kw:",
+                f"    kw[{arg!r}] = args[consumed]",
+                "    consumed += 1",
+            )
+        )
+
+    body: list[str] = [
+        solve.format(f"extra_deps[{i}]")
+        + "(*args, stack=stack, cache_dependencies=cache, nested=True, **kw)"
+        for i in range(len(model.extra_dependencies))
+    ]
+    for i, dep_arg in enumerate(model.dependencies):
+        body.extend(
+            (
+                f"if {dep_arg!r} not in kw:",
+                f"    kw[{dep_arg!r}] = "
+                + solve.format(f"deps[{i}][1]")
+                + "(*args, stack=stack, cache_dependencies=cache, nested=True, **kw)",
+            )
+        )
+
+    if model.serializer is not None:
+        body.append("kw.update(_serializer(kw))")
+
+    body.append("call_kwargs = {}")
+    body.extend(
+        f"if {arg!r} in kw: call_kwargs[{arg!r}] = kw[{arg!r}]"
+        for arg in model._call_keyword_args
+    )
+
+    if model.serializer is not None:
+        body.append(f"return _serializer.response({call})")
+    else:
+        body.append(f"return {call}")
+
+    if model.extra_dependencies or model.dependencies:
+        lines.extend(
+            (
+                "args = args[consumed:]",
+                "extra_deps, deps = _model._resolve_dependencies(_model.dependency_provider)",
+                "cache = {}",
+                # nothing is pushed to the stack without generator dependencies
+                "if not _model.needs_stack():",
+                "    stack = None",
+            )
+        )
+        lines.extend(f"    {line}" for line in body)
+        lines.append(
+            "async with AsyncExitStack() as stack:"
+            if model.is_async
+            else "with ExitStack() as stack:"
+        )
+        lines.extend(f"    {line}" for line in body)
+    else:
+        lines.extend(body)
+
+    source = "\n    ".join(lines)
+    exec(
+        compile(source, f"<fast_depends injected {model.call_name}>", "exec"),
+        namespace,
+    )
+
+    wrapper: Callable[..., Any] = namespace["injected_wrapper"]
+    wrapper.__fastdepends_source__ = source  # type: ignore[attr-defined]
+    return wrapper
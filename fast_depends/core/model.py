@@ -1,28 +1,45 @@
-from collections.abc import Callable, Generator, Iterable, Sequence
-from contextlib import AsyncExitStack, ExitStack
+import json
+import threading
+from collections.abc import Callable, Hashable, Iterable, Mapping, Sequence
+from contextlib import AsyncExitStack, ExitStack, contextmanager
+from functools import partial
 from inspect import Parameter, unwrap
+from itertools import count
 from typing import (
     TYPE_CHECKING,
     Any,
+    Optional,
+    Union,
 )
 
-import anyio
-
 from fast_depends._compat import ExceptionGroup
+from fast_depends.dependencies.memo import MemoCache
+from fast_depends.exceptions import ValidationError
 from fast_depends.library.model import CustomField
 from fast_depends.library.serializer import OptionItem, Serializer, SerializerProto
 from fast_depends.utils import (
+    async_batch_map,
     async_map,
+    batch_map,
+    contextmanager_in_threadpool,
     is_async_gen_callable,
     is_coroutine_callable,
     is_gen_callable,
-    run_async,
+    run_in_pool,
     solve_generator_async,
     solve_generator_sync,
 )
 
 if TYPE_CHECKING:
+    import anyio
+
+    from fast_depends.dependencies.memo import Memoize
+    from fast_depends.dependencies.model import Execution, Scope
     from fast_depends.dependencies.provider import Key, Provider
+    from fast_depends.utils import ThreadPool
+
+
+_cache_slots = count()
 
 
 class CallModel:
@@ -31,7 +48,7 @@ class CallModel:
         "is_async",
         "is_generator",
         "params",
-        "alias_arguments",
+        "_alias_arguments",
         "args_name",
         "positional_args",
         "kwargs_name",
@@ -43,9 +60,55 @@ class CallModel:
         "serializer",
         "dependency_provider",
         "serializer_cls",
+        "concurrent",
+        "scope",
+        "memoize",
+        "coalesce",
+        "execution",
+        "thread_pool",
+        "stream_batch_size",
+        "cache_slot",
+        "has_teardown",
+        # binding plan, precomputed once at build time (or on the first solve)
+        "_args_is_alias",
+        "_kwargs_is_alias",
+        "_bind_positional_args",
+        "_call_keyword_args",
+        "_dependencies_items",
+        "_custom_fields",
+        "_field_custom_fields",
+        "_use_custom_fields",
+        "_own_names",
+        "_run_inline",
+        "_sync_solvable",
+        "_validates_json",
+        # dependency models resolved for the provider epoch
+        "_resolved",
+        # subtree scheduling info kept for the provider epoch
+        "_subtree",
+        "_sync_subtree",
+    )
+
+    _alias_arguments: tuple[str, ...] | None
+    _args_is_alias: bool | None
+    _resolved: (
+        tuple[
+            "Provider", int, tuple["CallModel", ...], tuple[tuple[str, "CallModel"], ...]
+        ]
+        | None
     )
+    _subtree: tuple[int, tuple[bool, frozenset[str] | None]] | None
+    _sync_subtree: tuple[int, Optional["ThreadPool"], bool] | None
 
-    alias_arguments: tuple[str, ...]
+    @property
+    def alias_arguments(self) -> tuple[str, ...]:
+        # computed on demand to not build a lazy serializer
+        if self._alias_arguments is None:
+            if self.serializer is not None:
+                self._alias_arguments = self.serializer.get_aliases()
+            else:  # pragma: no cover
+                self._alias_arguments = ()
+        return self._alias_arguments
 
     @property
     def call_name(self) -> str:
@@ -82,14 +145,18 @@ class CallModel:
         custom_fields: dict[str, CustomField],
         dependency_provider: "Provider",
         serializer_cls: SerializerProto | None,
+        concurrent: bool = False,
+        scope: "Scope" = "call",
+        memoize: Optional["Memoize"] = None,
+        coalesce: bool = False,
+        execution: "Execution" = "default",
+        thread_pool: Union[str, "ThreadPool", None] = None,
+        stream_batch_size: int | None = None,
     ):
         self.call = call
         self.serializer = serializer
 
-        if serializer is not None:
-            self.alias_arguments = serializer.get_aliases()
-        else:  # pragma: no cover
-            self.alias_arguments = ()
+        self._alias_arguments = None
 
         self.args_name = args_name
         self.keyword_args = tuple(keyword_args or ())
@@ -110,63 +177,294 @@ class CallModel:
         self.params = params
         self.dependency_provider = dependency_provider
         self.serializer_cls = serializer_cls
+        self.concurrent = concurrent
+        self.scope = scope
+        self.memoize = memoize
+        self.coalesce = coalesce
+        self.execution = execution
+        self.thread_pool = thread_pool
+        self.stream_batch_size = stream_batch_size
 
-    def _solve(
+        # every model (overrides included) gets its own key in the call cache
+        self.cache_slot = next(_cache_slots)
+        self._resolved = None
+        self._subtree = None
+        self._sync_subtree = None
+
+        self._compile()
+
+    def _compile(self) -> None:
+        """Precompute everything `solve` needs to bind arguments.
+
+        This way a call only interprets ready-to-use tuples instead of
+        re-deriving them from the model signature each time.
+        """
+        # checking `*args` and `**kwargs` aliases builds a lazy serializer,
+        # so such signatures are bound by a plan made on the first solve
+        self._args_is_alias = None
+        if self.args_name is None and self.kwargs_name is None:
+            self._compile_arguments()
+
+        self._dependencies_items = tuple(self.dependencies.items())
+
+        # sync code is sent to the threadpool by default
+        self._run_inline = self.execution == "inline"
+
+        self._custom_fields = tuple(self.custom_fields.values())
+        self._field_custom_fields = tuple(c for c in self._custom_fields if c.field)
+        self._use_custom_fields = tuple(c for c in self._custom_fields if not c.field)
+
+        # such a node can be solved by `solve` in a worker thread along with its subtree
+        self._sync_solvable = not (
+            self.is_async
+            or self.is_generator
+            or self.coalesce
+            or self._run_inline
+            or self.scope != "call"
+            or any(
+                is_coroutine_callable(c.use_field if c.field else c.use)
+                for c in self._custom_fields
+            )
+        )
+
+        # original dependencies are registered before the model is built;
+        # overrides are resolved at call time, so `needs_stack` checks them separately
+        self.has_teardown: bool = self.is_generator or any(
+            self.dependency_provider.dependencies[key].has_teardown
+            for key in (*self.dependencies.values(), *self.extra_dependencies)
+        )
+
+        # all call arguments come from the payload, so it can be validated as raw bytes
+        self._validates_json = self.serializer is not None and not (
+            self.dependencies
+            or self.extra_dependencies
+            or self._custom_fields
+            or self.args_name
+            or self.kwargs_name
+            or self.is_generator
+            or self.memoize
+            or self.coalesce
+            or self.scope != "call"
+        )
+
+        # `None` means the call can consume any incoming keyword
+        self._own_names: frozenset[str] | None
+        if self.kwargs_name or self._custom_fields:
+            self._own_names = None
+        else:
+            self._own_names = frozenset(
+                (*self.keyword_args, *self.positional_args, *self.dependencies)
+            )
+
+    def _compile_arguments(self) -> None:
+        self._kwargs_is_alias = (
+            self.kwargs_name is not None and self.kwargs_name in self.alias_arguments
+        )
+
+        args_is_alias = (
+            self.args_name is not None and self.args_name in self.alias_arguments
+        )
+        if args_is_alias:
+            self._call_keyword_args = self.keyword_args
+        else:
+            self._call_keyword_args = self.keyword_args + self.positional_args
+
+        self._bind_positional_args = tuple(
+            arg for arg in self._call_keyword_args if arg not in self.dependencies
+        )
+
+        # set last as the flag the plan is ready
+        self._args_is_alias = args_is_alias
+
+    def warmup(self) -> None:
+        """Build lazy serializers of the call and all its dependencies."""
+        if self.serializer is not None:
+            self.serializer.warmup()
+
+        for dep in map(
+            self.dependency_provider.get_dependant,
+            (*self.dependencies.values(), *self.extra_dependencies),
+        ):
+            dep.warmup()
+
+    def _resolve_dependencies(
         self,
-        /,
-        *args: tuple[Any, ...],
-        cache_dependencies: dict[Callable[..., Any], Any],
-        **kwargs: dict[str, Any],
-    ) -> Generator[
-        tuple[
-            tuple[Any, ...],
-            dict[str, Any],
-        ],
-        Any,
-        Any,
-    ]:
-        if self.use_cache and self.call in cache_dependencies:
-            return cache_dependencies[self.call]
+        provider: "Provider",
+    ) -> tuple[tuple["CallModel", ...], tuple[tuple[str, "CallModel"], ...]]:
+        """Extra and regular dependency models with overrides applied.
+
+        They are kept for the last provider and resolved again only when the
+        provider epoch changes.
+        """
+        if provider.has_local_overrides():
+            # context overrides are not shared between calls, so they are not kept
+            return (
+                tuple(map(provider.get_dependant, self.extra_dependencies)),
+                tuple(
+                    (dep_arg, provider.get_dependant(dep_key))
+                    for dep_arg, dep_key in self._dependencies_items
+                ),
+            )
+
+        resolved = self._resolved
+        if (
+            resolved is None
+            or resolved[0] is not provider
+            or resolved[1] != provider.epoch
+        ):
+            # the epoch is read first to not keep models resolved by a stale table
+            epoch = provider.epoch
+            resolved = self._resolved = (
+                provider,
+                epoch,
+                tuple(map(provider.get_dependant, self.extra_dependencies)),
+                tuple(
+                    (dep_arg, provider.get_dependant(dep_key))
+                    for dep_arg, dep_key in self._dependencies_items
+                ),
+            )
+        return resolved[2], resolved[3]
+
+    def needs_stack(self) -> bool:
+        """Whether a call can push generator teardowns to the exit stack."""
+        provider = self.dependency_provider
+        return (
+            self.has_teardown
+            or bool(provider.overrides)
+            or provider.has_local_overrides()
+        )
+
+    def _subtree_info(self) -> tuple[bool, frozenset[str] | None]:
+        """Inspect the dependency subtree to schedule it next to its siblings.
+
+        Returns whether the subtree can be solved in a separate task (it has no
+        generators, those should be entered and exited in the same task) and
+        the names it may consume from the parent keywords.
+        The result is kept until the provider epoch changes.
+        """
+        provider = self.dependency_provider
+        if provider.has_local_overrides():
+            return self._inspect_subtree(provider)
+
+        cached = self._subtree
+        if cached is None or cached[0] != provider.epoch:
+            epoch = provider.epoch
+            cached = self._subtree = (epoch, self._inspect_subtree(provider))
+        return cached[1]
+
+    def _inspect_subtree(
+        self,
+        provider: "Provider",
+    ) -> tuple[bool, frozenset[str] | None]:
+        if self.is_generator:
+            return False, None
+
+        names = self._own_names
+        for dep in map(
+            provider.get_dependant,
+            (*self.dependencies.values(), *self.extra_dependencies),
+        ):
+            is_safe, dep_names = dep._subtree_info()
+            if not is_safe:
+                return False, None
+
+            if names is not None:
+                names = None if dep_names is None else names | dep_names
+
+        return True, names
+
+    def _can_solve_sync(self, pool: Optional["ThreadPool"]) -> bool:
+        """Check the whole subtree can be solved by `solve` in a single `pool` call.
+
+        The result is kept for the last `pool` until the provider epoch changes.
+        """
+        provider = self.dependency_provider
+        if provider.has_local_overrides():
+            return self._check_sync_subtree(provider, pool)
+
+        cached = self._sync_subtree
+        if cached is None or cached[0] != provider.epoch or cached[1] is not pool:
+            epoch = provider.epoch
+            cached = self._sync_subtree = (
+                epoch,
+                pool,
+                self._check_sync_subtree(provider, pool),
+            )
+        return cached[2]
+
+    def _check_sync_subtree(
+        self,
+        provider: "Provider",
+        pool: Optional["ThreadPool"],
+    ) -> bool:
+        if not self._sync_solvable or self._get_thread_pool() is not pool:
+            return False
+
+        return all(
+            dep._can_solve_sync(pool)
+            for dep in map(
+                provider.get_dependant,
+                (*self.dependencies.values(), *self.extra_dependencies),
+            )
+        )
+
+    def _bind_arguments(
+        self,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        if self._args_is_alias is None:
+            self._compile_arguments()
 
         kw: dict[str, Any] = {}
         for arg in self.keyword_args:
             if (v := kwargs.pop(arg, Parameter.empty)) is not Parameter.empty:
                 kw[arg] = v
 
-        if self.kwargs_name in self.alias_arguments:
-            kw[self.kwargs_name] = kwargs
+        if self._kwargs_is_alias:
+            kw[self.kwargs_name] = kwargs  # type: ignore[index]
         else:
             kw.update(kwargs)
 
+        consumed, args_count = 0, len(args)
         for arg in self.positional_args:
             if arg not in kw:
-                if args:
-                    kw[arg], args = args[0], args[1:]
+                if consumed < args_count:
+                    kw[arg] = args[consumed]
+                    consumed += 1
                 else:
                     break
 
-        keyword_args: Iterable[str]
-        if self.args_name in self.alias_arguments:
-            kw[self.args_name] = args
-            keyword_args = self.keyword_args
+        if self._args_is_alias:
+            kw[self.args_name] = args[consumed:]  # type: ignore[index]
 
         else:
-            keyword_args = self.keyword_args + self.positional_args
-            for arg in keyword_args:
-                if not args:
+            for arg in self._bind_positional_args:
+                if consumed >= args_count:
                     break
 
-                if arg not in self.dependencies and arg not in kw:
-                    kw[arg], args = args[0], args[1:]
+                if arg not in kw:
+                    kw[arg] = args[consumed]
+                    consumed += 1
 
-        solved_kw: dict[str, Any]
-        solved_kw = yield args, kw
+        return args[consumed:], kw
 
-        args_: Sequence[Any]
+    def _build_call_arguments(
+        self,
+        args: tuple[Any, ...],
+        solved_kw: dict[str, Any],
+    ) -> tuple[Sequence[Any], dict[str, Any]]:
         if self.serializer is not None:
-            casted_options = self.serializer(solved_kw)
-            solved_kw.update(casted_options)
+            solved_kw.update(self.serializer(solved_kw))
 
+        return self._split_call_arguments(args, solved_kw)
+
+    def _split_call_arguments(
+        self,
+        args: tuple[Any, ...],
+        solved_kw: dict[str, Any],
+    ) -> tuple[Sequence[Any], dict[str, Any]]:
+        args_: Sequence[Any]
         if self.args_name:
             args_ = (
                 *map(solved_kw.pop, self.positional_args),
@@ -175,17 +473,24 @@ class CallModel:
         else:
             args_ = ()
 
-        kwargs_ = {arg: solved_kw.pop(arg) for arg in keyword_args if arg in solved_kw}
+        kwargs_ = {
+            arg: solved_kw.pop(arg) for arg in self._call_keyword_args if arg in solved_kw
+        }
         if self.kwargs_name:
             kwargs_.update(solved_kw.get(self.kwargs_name, solved_kw))
 
-        response = yield args_, kwargs_
+        return args_, kwargs_
 
+    def _store_response(
+        self,
+        response: Any,
+        cache_dependencies: dict[int, Any],
+    ) -> Any:
         if not self.is_generator:
             response = self._cast_response(response)
 
         if self.use_cache:  # pragma: no branch
-            cache_dependencies[self.call] = response
+            cache_dependencies[self.cache_slot] = response
 
         return response
 
@@ -197,30 +502,394 @@ class CallModel:
     def solve(
         self,
         /,
-        *args: tuple[Any, ...],
-        stack: ExitStack,
-        cache_dependencies: dict[Callable[..., Any], Any],
+        *args: Any,
+        stack: ExitStack | None,
+        cache_dependencies: dict[int, Any],
         nested: bool = False,
         dependency_provider: "Provider | None" = None,
-        **kwargs: dict[str, Any],
+        **kwargs: Any,
     ) -> Any:
-        cast_gen = self._solve(
+        if (
+            self.use_cache
+            and (cached := cache_dependencies.get(self.cache_slot, Parameter.empty))
+            is not Parameter.empty
+        ):
+            if cached.__class__ is _PendingResult:
+                # solved by a concurrent sibling, see `_solve_sync_batch`
+                raise _PendingDependencyError
+            return cached
+
+        if self.scope == "app":
+            return self._solve_app_scoped(
+                *args,
+                cache_dependencies=cache_dependencies,
+                dependency_provider=dependency_provider,
+                **kwargs,
+            )
+
+        return self._solve(
             *args,
+            stack=stack,
             cache_dependencies=cache_dependencies,
+            nested=nested,
+            dependency_provider=dependency_provider,
             **kwargs,
         )
+
+    def _solve_app_scoped(
+        self,
+        /,
+        *args: Any,
+        cache_dependencies: dict[int, Any],
+        dependency_provider: "Provider | None",
+        **kwargs: Any,
+    ) -> Any:
+        app_state = self.dependency_provider.app_state
+        while True:
+            with app_state.lock:
+                value = app_state.values.get(self.call, Parameter.empty)
+
+                if value is Parameter.empty:
+                    # other sync and async calls wait for the single value being created
+                    app_state.values[self.call] = pending = _PendingResult()
+                    break
+
+                if value.__class__ is not _PendingResult:
+                    return value
+
+            # the value is being created by another call
+            try:
+                return value.wait_sync()
+            except _CallCancelledError:
+                # the owner task was cancelled, so try to create it ourselves
+                continue
+
         try:
-            args, kwargs = next(cast_gen)
-        except StopIteration as e:
-            cached_value = e.value
-            return cached_value
+            value = self._solve(
+                *args,
+                stack=app_state.stack,
+                cache_dependencies=cache_dependencies,
+                nested=True,
+                dependency_provider=dependency_provider,
+                **kwargs,
+            )
+        except BaseException as e:
+            with app_state.lock:
+                app_state.values.pop(self.call, None)
+            pending.set_error(e)
+            raise
+
+        with app_state.lock:
+            app_state.values[self.call] = value
+        pending.set_result(value)
+        return value
+
+    def _solve(
+        self,
+        /,
+        *args: Any,
+        stack: ExitStack | None,
+        cache_dependencies: dict[int, Any],
+        nested: bool,
+        dependency_provider: "Provider | None",
+        **kwargs: Any,
+    ) -> Any:
+        args, kwargs = self._bind_arguments(args, kwargs)
 
         if dependency_provider:
             provider = self.dependency_provider.merge(dependency_provider)
         else:
             provider = self.dependency_provider
 
-        for dep in map(provider.get_dependant, self.extra_dependencies):
+        self._solve_dependencies(
+            provider,
+            args,
+            kwargs,
+            stack=stack,
+            cache_dependencies=cache_dependencies,
+        )
+        kwargs = self._solve_custom_fields(kwargs)
+
+        final_args, final_kwargs = self._build_call_arguments(args, kwargs)
+
+        memo_key: Hashable | None = None
+        if self.memoize is not None:
+            memo_cache = self.dependency_provider.app_state.memo_cache(
+                self.call, self.memoize
+            )
+            memo_key = memo_cache.make_key(final_args, final_kwargs)
+
+            if memo_key is not None and (
+                (memoized := memo_cache.get(memo_key)) is not Parameter.empty
+            ):
+                if self.use_cache:
+                    cache_dependencies[self.cache_slot] = memoized
+                return memoized
+
+        if self.is_generator and nested:
+            assert stack is not None, (
+                f"Generator dependency `{self.call_name}` requires an exit stack"
+            )
+            response = solve_generator_sync(
+                *final_args,
+                call=self.call,
+                stack=stack,
+                **final_kwargs,
+            )
+
+        else:
+            response = self.call(*final_args, **final_kwargs)
+
+        response = self._store_response(response, cache_dependencies)
+
+        if memo_key is not None:
+            memo_cache.set(memo_key, response)
+
+        if self.serializer is None or nested or not self.is_generator:
+            return response
+
+        if self.stream_batch_size:
+            return batch_map(
+                self.serializer.response_batch, response, self.stream_batch_size
+            )
+
+        return map(self._cast_response, response)
+
+    def solve_json(
+        self,
+        data: bytes,
+        /,
+        *,
+        stack: ExitStack | None,
+        cache_dependencies: dict[int, Any],
+        **kwargs: Any,
+    ) -> Any:
+        """Solve the call with keyword arguments from a JSON object.
+
+        If all the call arguments come from the payload, the serializer validates
+        raw bytes in a single step. Otherwise the decoded payload is solved as
+        regular keyword arguments.
+        """
+        if self._validates_json and not kwargs:
+            final_args, final_kwargs = self._split_call_arguments(
+                (),
+                self.serializer.from_json(data),  # type: ignore[union-attr]
+            )
+            return self._store_response(
+                self.call(*final_args, **final_kwargs),
+                cache_dependencies,
+            )
+
+        return self.solve(
+            stack=stack,
+            cache_dependencies=cache_dependencies,
+            **(kwargs | self._decode_json(data)),
+        )
+
+    def _decode_json(self, data: bytes) -> dict[str, Any]:
+        serializer_cls = self.serializer_cls
+        try:
+            if serializer_cls is not None:
+                return serializer_cls.decode_object(data)
+
+            decoded = json.loads(data)
+            if not isinstance(decoded, dict):
+                raise TypeError(f"JSON payload of `{self.call_name}` should be an object")
+            return decoded
+
+        except Exception as e:
+            # the same error as the serializer raises for the flat calls payload
+            if not getattr(serializer_cls, "use_fastdepends_errors", True):
+                raise
+
+            raise ValidationError(
+                incoming_options=data,
+                locations=(),
+                expected={p.field_name: p for p in self.flat_params},
+                original_error=e,
+            ) from e
+
+    def solve_batch(
+        self,
+        items: Sequence[Mapping[str, Any]],
+        /,
+        *,
+        stack: ExitStack,
+    ) -> list[Any]:
+        """Solve the call for each keyword arguments mapping of `items`.
+
+        Dependencies not consuming the items arguments are solved once for the whole
+        batch, arguments and responses are validated by single serializer calls.
+        Generator dependencies of an item are closed with the item's own exception.
+        Returns the result or the raised exception for each item.
+        """
+        assert not self.is_generator, (
+            f"You cannot solve generator `{self.call_name}` in a batch"
+        )
+
+        provider = self.dependency_provider
+
+        shared_cache: dict[int, Any] = {}
+        shared_kwargs: dict[str, Any] = {}
+        for dep_arg, dep in self._batch_shared_dependencies(items):
+            result = dep.solve(
+                stack=stack,
+                cache_dependencies=shared_cache,
+                nested=True,
+                **shared_kwargs,
+            )
+            if dep_arg is not None:
+                shared_kwargs[dep_arg] = result
+
+        # each item tears its generators down with its own outcome
+        needs_stack = self.needs_stack()
+        item_stacks: dict[int, ExitStack] = {}
+        failed: set[int] = set()
+
+        results: list[Any] = [None] * len(items)
+        solved: list[tuple[int, tuple[Any, ...], dict[str, Any]]] = []
+        for i, item in enumerate(items):
+            item_stack = None
+            if needs_stack:
+                item_stack = item_stacks[i] = stack.enter_context(ExitStack())
+
+            args, kwargs = self._bind_arguments((), shared_kwargs | dict(item))
+            try:
+                self._solve_dependencies(
+                    provider,
+                    args,
+                    kwargs,
+                    stack=item_stack,
+                    cache_dependencies=shared_cache.copy(),
+                )
+                kwargs = self._solve_custom_fields(kwargs)
+            except Exception as e:
+                results[i] = e
+                failed.add(i)
+            else:
+                solved.append((i, args, kwargs))
+
+        called: list[int] = []
+        for (i, args, kwargs), validated in zip(
+            solved,
+            self._serialize_batch([kw for _, _, kw in solved]),
+            strict=True,
+        ):
+            if isinstance(validated, Exception):
+                results[i] = validated
+                failed.add(i)
+                continue
+
+            kwargs.update(validated)
+            final_args, final_kwargs = self._split_call_arguments(args, kwargs)
+            try:
+                results[i] = self.call(*final_args, **final_kwargs)
+            except Exception as e:
+                results[i] = e
+                failed.add(i)
+            else:
+                called.append(i)
+
+        for i, response in zip(
+            called,
+            self._cast_batch([results[i] for i in called]),
+            strict=True,
+        ):
+            results[i] = response
+            if isinstance(response, Exception):
+                failed.add(i)
+
+        for i, item_stack in item_stacks.items():
+            error = results[i] if i in failed else None
+            try:
+                if error is None:
+                    item_stack.close()
+                elif item_stack.__exit__(type(error), error, error.__traceback__):
+                    results[i] = None
+            except Exception as e:  # noqa: PERF203
+                results[i] = e
+
+        return results
+
+    def _batch_shared_dependencies(
+        self,
+        items: Sequence[Mapping[str, Any]],
+    ) -> list[tuple[str | None, "CallModel"]]:
+        """Find dependencies the same for all `items`.
+
+        Such a dependency subtree does not consume the items arguments
+        (and results of other dependencies consuming them) and has no generators.
+        """
+        varying: set[str] = set().union(*items)
+
+        shared: list[tuple[str | None, CallModel]] = []
+        extra_dependencies, dependencies = self._resolve_dependencies(
+            self.dependency_provider
+        )
+        for dep_arg, dep in (
+            *((None, dep) for dep in extra_dependencies),
+            *dependencies,
+        ):
+            is_safe, names = dep._subtree_info()
+            if (
+                dep.use_cache
+                and is_safe
+                and names is not None
+                and names.isdisjoint(varying)
+                and dep_arg not in varying
+            ):
+                shared.append((dep_arg, dep))
+
+            elif dep_arg is not None:
+                varying.add(dep_arg)
+
+        return shared
+
+    def _serialize_batch(self, calls_kwargs: list[dict[str, Any]]) -> list[Any]:
+        """Validate all calls arguments at once.
+
+        Falls back to item by item validation to find the failed ones.
+        """
+        if (serializer := self.serializer) is None:
+            return [{} for _ in calls_kwargs]
+
+        try:
+            return serializer.batch(calls_kwargs)
+        except Exception:
+            validated: list[Any] = []
+            for call_kwargs in calls_kwargs:
+                try:
+                    validated.append(serializer(call_kwargs))
+                except Exception as e:  # noqa: PERF203
+                    validated.append(e)
+            return validated
+
+    def _cast_batch(self, responses: list[Any]) -> list[Any]:
+        if (serializer := self.serializer) is None:
+            return responses
+
+        try:
+            return serializer.response_batch(responses)
+        except Exception:
+            casted: list[Any] = []
+            for response in responses:
+                try:
+                    casted.append(serializer.response(response))
+                except Exception as e:  # noqa: PERF203
+                    casted.append(e)
+            return casted
+
+    def _solve_dependencies(
+        self,
+        provider: "Provider",
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        stack: ExitStack | None,
+        cache_dependencies: dict[int, Any],
+    ) -> None:
+        extra_dependencies, dependencies = self._resolve_dependencies(provider)
+        for dep in extra_dependencies:
             dep.solve(
                 *args,
                 stack=stack,
@@ -229,9 +898,9 @@ class CallModel:
                 **kwargs,
             )
 
-        for dep_arg, dep_key in self.dependencies.items():
+        for dep_arg, dep in dependencies:
             if dep_arg not in kwargs:
-                kwargs[dep_arg] = provider.get_dependant(dep_key).solve(
+                kwargs[dep_arg] = dep.solve(
                     *args,
                     stack=stack,
                     cache_dependencies=cache_dependencies,
@@ -239,126 +908,728 @@ class CallModel:
                     **kwargs,
                 )
 
-        if self.custom_fields:
-            for custom in self.custom_fields.values():
-                if custom.field:
-                    custom.use_field(kwargs)
-                else:
-                    kwargs = custom.use(**kwargs)
+    def _solve_custom_fields(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        for custom in self._custom_fields:
+            if custom.field:
+                custom.use_field(kwargs)
+            else:
+                kwargs = custom.use(**kwargs)
+        return kwargs
 
-        final_args, final_kwargs = cast_gen.send(kwargs)
+    async def asolve(
+        self,
+        /,
+        *args: Any,
+        stack: AsyncExitStack | None,
+        cache_dependencies: dict[int, Any],
+        nested: bool = False,
+        dependency_provider: "Provider | None" = None,
+        **kwargs: Any,
+    ) -> Any:
+        if (
+            self.use_cache
+            and (cached := cache_dependencies.get(self.cache_slot, Parameter.empty))
+            is not Parameter.empty
+        ):
+            if cached.__class__ is _PendingResult:
+                return await cached.wait()
+            return cached
 
-        if self.is_generator and nested:
-            response = solve_generator_sync(
-                *final_args,
-                call=self.call,
+        if self.scope == "app":
+            return await self._asolve_app_scoped(
+                *args,
+                cache_dependencies=cache_dependencies,
+                dependency_provider=dependency_provider,
+                **kwargs,
+            )
+
+        if not (self.use_cache and self.concurrent):
+            return await self._asolve(
+                *args,
                 stack=stack,
-                **final_kwargs,
+                cache_dependencies=cache_dependencies,
+                nested=nested,
+                dependency_provider=dependency_provider,
+                **kwargs,
             )
 
+        # let concurrently solved siblings share the result instead of solving it twice
+        cache_dependencies[self.cache_slot] = pending = _PendingResult()
+        try:
+            response = await self._asolve(
+                *args,
+                stack=stack,
+                cache_dependencies=cache_dependencies,
+                nested=nested,
+                dependency_provider=dependency_provider,
+                **kwargs,
+            )
+        except BaseException as e:
+            cache_dependencies.pop(self.cache_slot, None)
+            pending.set_error(e)
+            raise
         else:
-            response = self.call(*final_args, **final_kwargs)
+            pending.set_result(cache_dependencies.get(self.cache_slot, response))
+            return response
 
-        try:
-            cast_gen.send(response)
-        except StopIteration as e:
-            value = e.value
+    async def _asolve_app_scoped(
+        self,
+        /,
+        *args: Any,
+        cache_dependencies: dict[int, Any],
+        dependency_provider: "Provider | None",
+        **kwargs: Any,
+    ) -> Any:
+        import anyio
 
-            if self.serializer is None or nested or not self.is_generator:
-                return value
+        app_state = self.dependency_provider.app_state
+        while True:
+            # shared with sync calls solving the value in other threads
+            with app_state.lock:
+                value = app_state.values.get(self.call, Parameter.empty)
 
-            else:
-                return map(self._cast_response, value)
+                if value is Parameter.empty:
+                    # concurrent tasks and sync calls wait for the single value
+                    app_state.values[self.call] = pending = _PendingResult()
+                    break
 
-        raise AssertionError("unreachable")
+                if value.__class__ is not _PendingResult:
+                    return value
 
-    async def asolve(
+            try:
+                return await value.wait()
+            except _CallCancelledError:  # noqa: PERF203
+                # the owner task was cancelled, so try to create it ourselves
+                continue
+
+        try:
+            value = await self._asolve(
+                *args,
+                stack=app_state.async_stack,
+                cache_dependencies=cache_dependencies,
+                nested=True,
+                dependency_provider=dependency_provider,
+                **kwargs,
+            )
+        except anyio.get_cancelled_exc_class():
+            with app_state.lock:
+                app_state.values.pop(self.call, None)
+            pending.set_error(_CallCancelledError())
+            raise
+        except BaseException as e:
+            with app_state.lock:
+                app_state.values.pop(self.call, None)
+            pending.set_error(e)
+            raise
+        else:
+            with app_state.lock:
+                app_state.values[self.call] = value
+            pending.set_result(value)
+            return value
+
+    async def _asolve(
         self,
         /,
-        *args: tuple[Any, ...],
-        stack: AsyncExitStack,
-        cache_dependencies: dict[Callable[..., Any], Any],
-        nested: bool = False,
-        dependency_provider: "Provider | None" = None,
-        **kwargs: dict[str, Any],
+        *args: Any,
+        stack: AsyncExitStack | None,
+        cache_dependencies: dict[int, Any],
+        nested: bool,
+        dependency_provider: "Provider | None",
+        **kwargs: Any,
     ) -> Any:
-        cast_gen = self._solve(
-            *args,
-            cache_dependencies=cache_dependencies,
-            **kwargs,
-        )
-        try:
-            args, kwargs = next(cast_gen)
-        except StopIteration as e:
-            cached_value = e.value
-            return cached_value
+        args, kwargs = self._bind_arguments(args, kwargs)
 
         if dependency_provider:
             provider = self.dependency_provider.merge(dependency_provider)
         else:
             provider = self.dependency_provider
 
-        for dep in map(provider.get_dependant, self.extra_dependencies):
-            # TODO: run concurrently
-            await dep.asolve(
-                *args,
+        if self.concurrent and (
+            len(self.extra_dependencies) + len(self._dependencies_items) > 1
+        ):
+            await self._asolve_dependencies_concurrently(
+                provider,
+                args,
+                kwargs,
                 stack=stack,
                 cache_dependencies=cache_dependencies,
-                nested=True,
-                **kwargs,
             )
 
-        for dep_arg, dep_key in self.dependencies.items():
-            if dep_arg not in kwargs:
-                kwargs[dep_arg] = await provider.get_dependant(
-                    dep_key
-                ).asolve(
-                    *args,
+        else:
+            await self._asolve_dependencies(
+                provider,
+                args,
+                kwargs,
+                stack=stack,
+                cache_dependencies=cache_dependencies,
+            )
+
+        kwargs = await self._asolve_custom_fields(kwargs)
+
+        final_args, final_kwargs = self._build_call_arguments(args, kwargs)
+
+        memo_key: Hashable | None = None
+        if self.memoize is not None:
+            memo_cache = self.dependency_provider.app_state.memo_cache(
+                self.call, self.memoize
+            )
+            memo_key = memo_cache.make_key(final_args, final_kwargs)
+
+            if memo_key is not None and (
+                (memoized := memo_cache.get(memo_key)) is not Parameter.empty
+            ):
+                if self.use_cache:
+                    cache_dependencies[self.cache_slot] = memoized
+                return memoized
+
+        if self.is_generator and nested:
+            assert stack is not None, (
+                f"Generator dependency `{self.call_name}` requires an exit stack"
+            )
+
+            if self.is_async:
+                response = await solve_generator_async(
+                    *final_args,
+                    call=self.call,
                     stack=stack,
-                    cache_dependencies=cache_dependencies,
-                    nested=True,
-                    **kwargs,
+                    **final_kwargs,
+                )
+            else:
+                cm = contextmanager(self.call)(*final_args, **final_kwargs)
+                if self._run_inline:
+                    response = stack.enter_context(cm)
+                else:
+                    response = await stack.enter_async_context(
+                        contextmanager_in_threadpool(cm, pool=self._get_thread_pool())
+                    )
+        elif self.coalesce and (
+            (coalesce_key := MemoCache.make_key(final_args, final_kwargs)) is not None
+        ):
+            response = await self._acall_coalesced(
+                coalesce_key,
+                final_args,
+                final_kwargs,
+            )
+        else:
+            response = await self._run_async(self.call, *final_args, **final_kwargs)
+
+        response = self._store_response(response, cache_dependencies)
+
+        if memo_key is not None:
+            memo_cache.set(memo_key, response)
+
+        if self.serializer is None or nested or not self.is_generator:
+            return response
+
+        if self.stream_batch_size:
+            return async_batch_map(
+                self.serializer.response_batch, response, self.stream_batch_size
+            )
+
+        return async_map(self._cast_response, response)
+
+    async def _run_async(
+        self,
+        func: Callable[..., Any],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        if is_coroutine_callable(func):
+            return await func(*args, **kwargs)
+
+        if self._run_inline:
+            return func(*args, **kwargs)
+
+        if kwargs:
+            func = partial(func, **kwargs)
+        return await run_in_pool(self._get_thread_pool(), func, *args)
+
+    def _get_thread_pool(self) -> Optional["ThreadPool"]:
+        pool = self.thread_pool
+        if pool is None:
+            pool = self.dependency_provider.default_thread_pool
+
+        if isinstance(pool, str):
+            return self.dependency_provider.get_thread_pool(pool)
+        return pool
+
+    async def _acall_coalesced(
+        self,
+        key: Hashable,
+        args: Sequence[Any],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Share a single in-flight call between concurrent calls with the same arguments."""
+        inflight = self.dependency_provider.app_state.inflight
+        key = (self.call, key)
+
+        while (pending := inflight.get(key)) is not None:
+            try:
+                return await pending.wait()
+            except _CallCancelledError:  # noqa: PERF203
+                # the owner task was cancelled, so try to make the call ourselves
+                continue
+
+        import anyio
+
+        inflight[key] = pending = _PendingResult()
+        try:
+            response = await self._run_async(self.call, *args, **kwargs)
+        except anyio.get_cancelled_exc_class():
+            pending.set_error(_CallCancelledError())
+            raise
+        except BaseException as e:
+            pending.set_error(e)
+            raise
+        else:
+            pending.set_result(response)
+            return response
+        finally:
+            inflight.pop(key, None)
+
+    async def asolve_json(
+        self,
+        data: bytes,
+        /,
+        *,
+        stack: AsyncExitStack | None,
+        cache_dependencies: dict[int, Any],
+        **kwargs: Any,
+    ) -> Any:
+        """Async version of `solve_json`."""
+        if self._validates_json and not kwargs:
+            final_args, final_kwargs = self._split_call_arguments(
+                (),
+                self.serializer.from_json(data),  # type: ignore[union-attr]
+            )
+            return self._store_response(
+                await self._run_async(self.call, *final_args, **final_kwargs),
+                cache_dependencies,
+            )
+
+        return await self.asolve(
+            stack=stack,
+            cache_dependencies=cache_dependencies,
+            **(kwargs | self._decode_json(data)),
+        )
+
+    async def asolve_batch(
+        self,
+        items: Sequence[Mapping[str, Any]],
+        /,
+        *,
+        stack: AsyncExitStack,
+    ) -> list[Any]:
+        """Async version of `solve_batch`."""
+        assert not self.is_generator, (
+            f"You cannot solve generator `{self.call_name}` in a batch"
+        )
+
+        provider = self.dependency_provider
+
+        shared_cache: dict[int, Any] = {}
+        shared_kwargs: dict[str, Any] = {}
+        for dep_arg, dep in self._batch_shared_dependencies(items):
+            result = await dep.asolve(
+                stack=stack,
+                cache_dependencies=shared_cache,
+                nested=True,
+                **shared_kwargs,
+            )
+            if dep_arg is not None:
+                shared_kwargs[dep_arg] = result
+
+        solve_dependencies = (
+            self._asolve_dependencies_concurrently
+            if self.concurrent
+            else self._asolve_dependencies
+        )
+
+        needs_stack = self.needs_stack()
+        item_stacks: dict[int, AsyncExitStack] = {}
+        failed: set[int] = set()
+
+        results: list[Any] = [None] * len(items)
+        solved: list[tuple[int, tuple[Any, ...], dict[str, Any]]] = []
+        for i, item in enumerate(items):
+            item_stack = None
+            if needs_stack:
+                item_stack = item_stacks[i] = await stack.enter_async_context(
+                    AsyncExitStack()
+                )
+
+            args, kwargs = self._bind_arguments((), shared_kwargs | dict(item))
+            try:
+                await solve_dependencies(
+                    provider,
+                    args,
+                    kwargs,
+                    stack=item_stack,
+                    cache_dependencies=shared_cache.copy(),
                 )
+                kwargs = await self._asolve_custom_fields(kwargs)
+            except Exception as e:
+                results[i] = e
+                failed.add(i)
+            else:
+                solved.append((i, args, kwargs))
+
+        called: list[int] = []
+        for (i, args, kwargs), validated in zip(
+            solved,
+            self._serialize_batch([kw for _, _, kw in solved]),
+            strict=True,
+        ):
+            if isinstance(validated, Exception):
+                results[i] = validated
+                failed.add(i)
+                continue
+
+            kwargs.update(validated)
+            final_args, final_kwargs = self._split_call_arguments(args, kwargs)
+            try:
+                results[i] = await self._run_async(self.call, *final_args, **final_kwargs)
+            except Exception as e:
+                results[i] = e
+                failed.add(i)
+            else:
+                called.append(i)
 
-        if self.custom_fields:
-            custom_to_solve: list[CustomField] = []
+        for i, response in zip(
+            called,
+            self._cast_batch([results[i] for i in called]),
+            strict=True,
+        ):
+            results[i] = response
+            if isinstance(response, Exception):
+                failed.add(i)
+
+        for i, item_stack in item_stacks.items():
+            error = results[i] if i in failed else None
+            try:
+                if error is None:
+                    await item_stack.aclose()
+                elif await item_stack.__aexit__(type(error), error, error.__traceback__):
+                    results[i] = None
+            except Exception as e:  # noqa: PERF203
+                results[i] = e
+
+        return results
+
+    async def _asolve_custom_fields(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        if self._field_custom_fields:
+            import anyio
 
             try:
                 async with anyio.create_task_group() as tg:
-                    for custom in self.custom_fields.values():
-                        if custom.field:
-                            tg.start_soon(run_async, custom.use_field, kwargs)
-                        else:
-                            custom_to_solve.append(custom)
+                    for custom in self._field_custom_fields:
+                        tg.start_soon(self._run_async, custom.use_field, kwargs)
 
             except ExceptionGroup as exgr:
                 for ex in exgr.exceptions:  # pragma: no branch
                     raise ex from None
 
-            for j in custom_to_solve:
-                kwargs = await run_async(j.use, **kwargs)
+        for custom in self._use_custom_fields:
+            kwargs = await self._run_async(custom.use, **kwargs)
 
-        final_args, final_kwargs = cast_gen.send(kwargs)
+        return kwargs
 
-        if self.is_generator and nested:
-            response = await solve_generator_async(
-                *final_args,
-                call=self.call,
+    async def _asolve_dependencies(
+        self,
+        provider: "Provider",
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        stack: AsyncExitStack | None,
+        cache_dependencies: dict[int, Any],
+    ) -> None:
+        extra_dependencies, dependencies = self._resolve_dependencies(provider)
+        nodes = [
+            *((None, dep) for dep in extra_dependencies),
+            *((dep_arg, dep) for dep_arg, dep in dependencies if dep_arg not in kwargs),
+        ]
+
+        # consecutive sync subtrees are sent to the threadpool all together
+        batch: list[tuple[str | None, CallModel]] = []
+        batch_pool: ThreadPool | None = None
+        for dep_arg, dep in nodes:
+            if not self.concurrent:
+                pool = dep._get_thread_pool()
+                if dep._can_solve_sync(pool):
+                    if batch and pool is not batch_pool:
+                        await self._solve_sync_batch(
+                            batch, batch_pool, args, kwargs, stack, cache_dependencies
+                        )
+                        batch = []
+
+                    batch.append((dep_arg, dep))
+                    batch_pool = pool
+                    continue
+
+            if batch:
+                await self._solve_sync_batch(
+                    batch, batch_pool, args, kwargs, stack, cache_dependencies
+                )
+                batch = []
+
+            result = await dep.asolve(
+                *args,
                 stack=stack,
-                **final_kwargs,
+                cache_dependencies=cache_dependencies,
+                nested=True,
+                **kwargs,
             )
-        else:
-            response = await run_async(self.call, *final_args, **final_kwargs)
+            if dep_arg is not None:
+                kwargs[dep_arg] = result
 
-        try:
-            cast_gen.send(response)
-        except StopIteration as e:
-            value = e.value
+        if batch:
+            await self._solve_sync_batch(
+                batch, batch_pool, args, kwargs, stack, cache_dependencies
+            )
+
+    async def _solve_sync_batch(
+        self,
+        batch: Sequence[tuple[str | None, "CallModel"]],
+        pool: Optional["ThreadPool"],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        stack: AsyncExitStack | None,
+        cache_dependencies: dict[int, Any],
+    ) -> None:
+        """Solve sync subtrees one by one in a single threadpool call.
+
+        The loop does not touch `kwargs` and the cache while waiting for the
+        worker, so they are updated in place the same way `solve` does.
+        A subtree meeting a value still solved by a concurrent sibling stops
+        the batch, the rest is solved by `asolve` to wait for it.
+        """
+
+        def solve_batch() -> int:
+            # subtrees have no generators, so nothing is pushed to the stack
+            with ExitStack() as sync_stack:
+                for i, (dep_arg, dep) in enumerate(batch):
+                    try:
+                        result = dep.solve(
+                            *args,
+                            stack=sync_stack,
+                            cache_dependencies=cache_dependencies,
+                            nested=True,
+                            **kwargs,
+                        )
+                    except _PendingDependencyError:
+                        return i
+
+                    if dep_arg is not None:
+                        kwargs[dep_arg] = result
+
+            return len(batch)
+
+        solved = await run_in_pool(pool, solve_batch)
+
+        for dep_arg, dep in batch[solved:]:
+            result = await dep.asolve(
+                *args,
+                stack=stack,
+                cache_dependencies=cache_dependencies,
+                nested=True,
+                **kwargs,
+            )
+            if dep_arg is not None:
+                kwargs[dep_arg] = result
+
+    async def _asolve_dependencies_concurrently(
+        self,
+        provider: "Provider",
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        stack: AsyncExitStack | None,
+        cache_dependencies: dict[int, Any],
+    ) -> None:
+        """Solve independent sibling dependencies in one task group.
+
+        Siblings are grouped into waves keeping the declaration order: a wave is
+        flushed when the next dependency consumes a result of the current one or
+        contains generators, which are solved in the current task.
+        """
+        extra_dependencies, dependencies = self._resolve_dependencies(provider)
+        nodes: list[tuple[str | None, CallModel]] = [
+            (None, dep) for dep in extra_dependencies
+        ]
+        nodes.extend(
+            (dep_arg, dep) for dep_arg, dep in dependencies if dep_arg not in kwargs
+        )
+
+        wave: list[tuple[str | None, CallModel]] = []
+        wave_names: set[str] = set()
+
+        for dep_arg, dep in nodes:
+            is_safe, consumed_names = dep._subtree_info()
+
+            if wave and (
+                not is_safe
+                or consumed_names is None
+                or not wave_names.isdisjoint(consumed_names)
+            ):
+                await self._asolve_wave(
+                    wave,
+                    args,
+                    kwargs,
+                    stack=stack,
+                    cache_dependencies=cache_dependencies,
+                )
+                wave, wave_names = [], set()
 
-            if self.serializer is None or nested or not self.is_generator:
-                return value
+            if is_safe:
+                wave.append((dep_arg, dep))
+                if dep_arg is not None:
+                    wave_names.add(dep_arg)
 
             else:
-                return async_map(self._cast_response, value)
+                result = await dep.asolve(
+                    *args,
+                    stack=stack,
+                    cache_dependencies=cache_dependencies,
+                    nested=True,
+                    **kwargs,
+                )
+                if dep_arg is not None:
+                    kwargs[dep_arg] = result
+
+        if wave:
+            await self._asolve_wave(
+                wave,
+                args,
+                kwargs,
+                stack=stack,
+                cache_dependencies=cache_dependencies,
+            )
+
+    async def _asolve_wave(
+        self,
+        wave: list[tuple[str | None, "CallModel"]],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        stack: AsyncExitStack | None,
+        cache_dependencies: dict[int, Any],
+    ) -> None:
+        if len(wave) == 1:
+            dep_arg, dep = wave[0]
+            result = await dep.asolve(
+                *args,
+                stack=stack,
+                cache_dependencies=cache_dependencies,
+                nested=True,
+                **kwargs,
+            )
+            if dep_arg is not None:
+                kwargs[dep_arg] = result
+            return
+
+        results: dict[str, Any] = {}
+
+        async def solve_one(dep_arg: str | None, dep: "CallModel") -> None:
+            result = await dep.asolve(
+                *args,
+                stack=stack,
+                cache_dependencies=cache_dependencies,
+                nested=True,
+                **kwargs,
+            )
+            if dep_arg is not None:
+                results[dep_arg] = result
+
+        import anyio
+
+        try:
+            async with anyio.create_task_group() as tg:
+                for dep_arg, dep in wave:
+                    tg.start_soon(solve_one, dep_arg, dep)
+
+        except ExceptionGroup as exgr:
+            for ex in exgr.exceptions:  # pragma: no branch
+                raise ex from None
+
+        kwargs.update(results)
+
+
+class _CallCancelledError(Exception):
+    pass
+
+
+class _PendingDependencyError(Exception):
+    """Sync solving met a value which is still being solved by an async task."""
+
+
+class _PendingResult:
+    """Placeholder for a cached dependency which is still being solved."""
+
+    __slots__ = ("_event", "_sync_event", "_owner", "_result", "_error", "_done")
+
+    def __init__(self) -> None:
+        self._event: anyio.Event | None = None
+        self._sync_event: threading.Event | None = None
+        # thread solving the value
+        self._owner = threading.get_ident()
+        self._result: Any = None
+        self._error: BaseException | None = None
+        self._done = False
+
+    def set_result(self, value: Any) -> None:
+        with _pending_lock:
+            self._result, self._done = value, True
+        self._notify()
+
+    def set_error(self, error: BaseException) -> None:
+        with _pending_lock:
+            self._error, self._done = error, True
+        self._notify()
+
+    def _notify(self) -> None:
+        if self._event is not None:
+            self._event.set()
+        if self._sync_event is not None:
+            self._sync_event.set()
+
+    async def wait(self) -> Any:
+        if not self._done:
+            import anyio
+
+            if threading.get_ident() != self._owner:
+                # the owner thread cannot set an event of the current event loop
+                return await anyio.to_thread.run_sync(self.wait_sync)
+
+            if self._event is None:
+                self._event = anyio.Event()
+            await self._event.wait()
+
+        return self._get()
+
+    def wait_sync(self) -> Any:
+        """Block the current thread until the value is solved by the owner thread."""
+        with _pending_lock:
+            if not self._done:
+                if threading.get_ident() == self._owner:
+                    raise RuntimeError(
+                        "Cannot wait for a value being solved by the current thread "
+                        "event loop, use an async call instead"
+                    )
+
+                if self._sync_event is None:
+                    self._sync_event = threading.Event()
+            event = self._sync_event
+
+        if event is not None:
+            event.wait()
+        return self._get()
+
+    def _get(self) -> Any:
+        if self._error is not None:
+            raise self._error
+        return self._result
+
 
-        raise AssertionError("unreachable")
+# orders results setting with sync waiters registration
+_pending_lock = threading.Lock()
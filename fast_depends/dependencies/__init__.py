@@ -1,7 +1,9 @@
+from .memo import Memoize
 from .model import Dependant
 from .provider import Provider
 
 __all__ = (
     "Dependant",
+    "Memoize",
     "Provider",
 )
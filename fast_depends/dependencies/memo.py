@@ -0,0 +1,135 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from inspect import Parameter
+from threading import Lock
+from time import monotonic
+from typing import Any, NamedTuple
+
+
+class Memoize:
+    """Options to cache a pure dependency result between calls.
+
+    Results are keyed by the validated dependency arguments. Calls with unhashable
+    arguments are not cached.
+    """
+
+    __slots__ = (
+        "maxsize",
+        "ttl",
+        "max_weight",
+        "weigher",
+    )
+
+    def __init__(
+        self,
+        maxsize: int | None = 128,
+        *,
+        ttl: float | None = None,
+        max_weight: float | None = None,
+        weigher: Callable[[Any], float] | None = None,
+    ) -> None:
+        assert max_weight is None or weigher is not None, (
+            "You should specify `weigher` to use `max_weight`"
+        )
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_weight = max_weight
+        self.weigher = weigher
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(maxsize={self.maxsize}, ttl={self.ttl})"
+
+
+class MemoInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    maxsize: int | None
+    weight: float
+
+
+class MemoCache:
+    __slots__ = (
+        "options",
+        "hits",
+        "misses",
+        "evictions",
+        "weight",
+        "_data",
+        "_lock",
+    )
+
+    def __init__(self, options: Memoize) -> None:
+        self.options = options
+        self.hits = self.misses = self.evictions = 0
+        self.weight: float = 0
+        # key -> (value, expiration time, weight)
+        self._data: OrderedDict[Hashable, tuple[Any, float | None, float]] = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def make_key(args: Sequence[Any], kwargs: dict[str, Any]) -> Hashable | None:
+        key = (tuple(args), tuple(kwargs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+
+            if item is not None:
+                value, expires, _ = item
+                if expires is None or expires > monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+
+                self._pop(key)
+                self.evictions += 1
+
+            self.misses += 1
+            return Parameter.empty
+
+    def set(self, key: Hashable, value: Any) -> None:
+        options = self.options
+
+        expires = None if options.ttl is None else monotonic() + options.ttl
+        weight = 0 if options.weigher is None else options.weigher(value)
+
+        with self._lock:
+            if key in self._data:
+                self._pop(key)
+
+            self._data[key] = (value, expires, weight)
+            self.weight += weight
+
+            while self._data and (
+                (options.maxsize is not None and len(self._data) > options.maxsize)
+                or (options.max_weight is not None and self.weight > options.max_weight)
+            ):
+                self._pop(next(iter(self._data)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.weight = 0
+
+    def info(self) -> MemoInfo:
+        return MemoInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            currsize=len(self._data),
+            maxsize=self.options.maxsize,
+            weight=self.weight,
+        )
+
+    def _pop(self, key: Hashable) -> None:
+        _, _, weight = self._data.pop(key)
+        self.weight -= weight
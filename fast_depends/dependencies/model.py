@@ -1,11 +1,24 @@
 from collections.abc import Callable
 from inspect import unwrap
-from typing import Any
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias, Union
+
+from fast_depends.dependencies.memo import Memoize
+
+if TYPE_CHECKING:
+    from fast_depends.utils import ThreadPool
+
+Scope: TypeAlias = Literal["call", "app"]
+Execution: TypeAlias = Literal["default", "inline", "thread"]
 
 
 class Dependant:
     use_cache: bool
     cast: bool
+    scope: Scope
+    memoize: Memoize | None
+    coalesce: bool
+    execution: Execution
+    thread_pool: Union[str, "ThreadPool", None]
 
     def __init__(
         self,
@@ -14,14 +27,28 @@ class Dependant:
         use_cache: bool,
         cast: bool,
         cast_result: bool,
+        scope: Scope = "call",
+        memoize: bool | Memoize = False,
+        coalesce: bool = False,
+        execution: Execution = "default",
+        thread_pool: Union[str, "ThreadPool", None] = None,
     ) -> None:
         self.dependency = dependency
         self.use_cache = use_cache
         self.cast = cast
         self.cast_result = cast_result
+        self.scope = scope
+
+        if memoize is True:
+            memoize = Memoize()
+        self.memoize = memoize or None
+        self.coalesce = coalesce
+        self.execution = execution
+        self.thread_pool = thread_pool
 
     def __repr__(self) -> str:
         call = unwrap(self.dependency)
         attr = getattr(call, "__name__", type(call).__name__)
         cache = "" if self.use_cache else ", use_cache=False"
-        return f"{self.__class__.__name__}({attr}{cache})"
+        scope = "" if self.scope == "call" else f", scope={self.scope!r}"
+        return f"{self.__class__.__name__}({attr}{cache}{scope})"
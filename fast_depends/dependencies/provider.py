@@ -1,32 +1,158 @@
-from collections.abc import Callable, Hashable, Iterator
-from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, TypeAlias
+import warnings
+from collections import ChainMap
+from collections.abc import Callable, Hashable, Iterator, Mapping, MutableMapping
+from contextlib import AsyncExitStack, ExitStack, contextmanager
+from contextvars import ContextVar
+from threading import RLock
+from typing import TYPE_CHECKING, Any, Optional, TypeAlias, Union
+from weakref import WeakKeyDictionary, WeakSet
 
 from fast_depends.core import build_call_model
+from fast_depends.dependencies.memo import MemoCache, MemoInfo, Memoize
 
 if TYPE_CHECKING:
     from fast_depends.core import CallModel
+    from fast_depends.dependencies.model import Scope
+    from fast_depends.utils import ThreadPool
 
 
 Key: TypeAlias = Hashable
 
 
-class Provider:
-    dependencies: dict[Key, "CallModel"]
-    overrides: dict[Key, "CallModel"]
+class AppState:
+    """State shared between calls: `scope="app"` dependency values, their teardown
+    stacks, memoized results and in-flight coalesced calls.
+    """
+
+    __slots__ = (
+        "values",
+        "lock",
+        "stack",
+        "async_stack",
+        "memo",
+        "inflight",
+    )
 
     def __init__(self) -> None:
+        self.values: dict[Callable[..., Any], Any] = {}
+        self.lock = RLock()
+        self.stack = ExitStack()
+        self.async_stack = AsyncExitStack()
+        self.memo: dict[Callable[..., Any], MemoCache] = {}
+        self.inflight: dict[Hashable, Any] = {}
+
+    def memo_cache(self, call: Callable[..., Any], options: Memoize) -> MemoCache:
+        if (cache := self.memo.get(call)) is None:
+            cache = self.memo.setdefault(call, MemoCache(options))
+        return cache
+
+
+class Provider:
+    dependencies: MutableMapping[Key, "CallModel"]
+    overrides: MutableMapping[Key, "CallModel"]
+    app_state: AppState
+    build_cache: dict[Hashable, tuple["CallModel", list[tuple[Key, "CallModel"]]]]
+    # bumped on each dependencies or overrides change made by the provider methods
+    epoch: int
+
+    def __init__(
+        self,
+        *,
+        thread_pools: Mapping[str, "ThreadPool"] | None = None,
+        default_thread_pool: Union[str, "ThreadPool", None] = None,
+    ) -> None:
         self.dependencies = {}
         self.overrides = {}
+        self.app_state = AppState()
+        # dependency models reused between call sites, see `build_call_model`
+        self.build_cache = {}
+        self.epoch = 0
+        self._resolved: dict[Key, CallModel] = {}
+        # override models reused by `override` and `local_scope`
+        self._override_models: dict[Hashable, CallModel] = {}
+        # current context overrides of the provider and the providers it is merged from
+        self._local_overrides: tuple[ContextVar[Mapping[Key, CallModel] | None], ...] = (
+            ContextVar(f"fast_depends_local_overrides_{id(self)}", default=None),
+        )
+
+        # capacity limiters or executors to run blocking dependencies
+        self.thread_pools = dict(thread_pools or {})
+        self.default_thread_pool = default_thread_pool
+        # views merging the provider over other ones, keyed by the provider below;
+        # kept by the overlay to die with it (the view references the overlay models)
+        self._merged: WeakKeyDictionary[Provider, Provider] = WeakKeyDictionary()
+        # merged views over the provider to notify about changes
+        self._views: WeakSet[Provider] = WeakSet()
+
+    def get_thread_pool(self, name: str) -> "ThreadPool":
+        try:
+            return self.thread_pools[name]
+        except KeyError:
+            raise KeyError(
+                f"Thread pool `{name}` is not registered at the dependency provider"
+            ) from None
 
     def merge(self, provider: "Provider") -> "Provider":
-        p = Provider()
-        p.dependencies = self.dependencies | provider.dependencies
-        p.overrides = self.overrides | provider.overrides
-        return p
+        """Layer `provider` dependencies and overrides over the current ones.
+
+        The result is a copy-on-write view over both providers, so it follows their
+        changes and is cached per `provider` instead of being copied on each call.
+        """
+        if (merged := provider._merged.get(self)) is None:
+            merged = Provider()
+            merged.dependencies = ChainMap(
+                {}, *_layers(provider.dependencies), *_layers(self.dependencies)
+            )
+            merged.overrides = ChainMap(
+                {}, *_layers(provider.overrides), *_layers(self.overrides)
+            )
+            provider._merged[self] = merged
+            merged._local_overrides += (
+                *provider._local_overrides,
+                *self._local_overrides,
+            )
+            self._views.add(merged)
+            provider._views.add(merged)
+        return merged
 
     def clear(self) -> None:
-        self.overrides = {}
+        # clear inplace to keep merged views consistent
+        self.overrides.clear()
+        self._override_models.clear()
+        self._invalidate_build_cache()
+        self._bump_epoch()
+
+    def memo_info(self, dependency: Callable[..., Any]) -> MemoInfo | None:
+        """Statistics of the `memoize` dependency results cache."""
+        if (cache := self.app_state.memo.get(dependency)) is None:
+            return None
+        return cache.info()
+
+    def close(self) -> None:
+        """Teardown `scope="app"` dependencies solved by sync calls.
+
+        The next call creates them again.
+        """
+        state, self.app_state = self.app_state, AppState()
+        if state.async_stack._exit_callbacks:  # type: ignore[attr-defined]
+            warnings.warn(
+                '`scope="app"` dependencies solved by async calls are not torn down '
+                "by `Provider.close()`, use `await Provider.aclose()` instead",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        state.stack.close()
+
+    async def aclose(self) -> None:
+        """Teardown all `scope="app"` dependencies.
+
+        The next call creates them again.
+        """
+        state, self.app_state = self.app_state, AppState()
+        try:
+            await state.async_stack.aclose()
+        finally:
+            state.stack.close()
 
     def add_dependant(
         self,
@@ -34,36 +160,77 @@ class Provider:
     ) -> Key:
         key = self.__get_original_key(dependant.call)
         self.dependencies[key] = dependant
+        self._bump_epoch()
         return key
 
     def get_dependant(self, key: Key) -> "CallModel":
-        return self.overrides.get(key) or self.dependencies[key]
+        if self.has_local_overrides() and (dependant := self._get_local_override(key)):
+            return dependant
+
+        try:
+            return self._resolved[key]
+        except KeyError:
+            dependant = self._resolved[key] = (
+                self.overrides.get(key) or self.dependencies[key]
+            )
+            return dependant
+
+    def has_local_overrides(self) -> bool:
+        """Whether the current context has `local_scope` overrides."""
+        return any(var.get() for var in self._local_overrides)
+
+    def _get_local_override(self, key: Key) -> Optional["CallModel"]:
+        for var in self._local_overrides:
+            if (overrides := var.get()) and (dependant := overrides.get(key)):
+                return dependant
+        return None
 
     def override(
         self,
         original: Callable[..., Any],
         override: Callable[..., Any],
     ) -> None:
+        key, override_model = self._get_override_model(original, override)
+        self._invalidate_build_cache()
+        self.overrides[key] = override_model
+        self._bump_epoch()
+
+    def _get_override_model(
+        self,
+        original: Callable[..., Any],
+        override: Callable[..., Any],
+    ) -> tuple[Key, "CallModel"]:
+        """Build the override model once per original dependency options."""
         key = self.__get_original_key(original)
 
         serializer_cls = None
+        scope: Scope = "call"
+        concurrent = False
 
         if original_dependant := self.dependencies.get(key):
             serializer_cls = original_dependant.serializer_cls
+            scope = original_dependant.scope
+            concurrent = original_dependant.concurrent
 
         else:
-            self.dependencies[key] = build_call_model(
-                original,
-                dependency_provider=self,
+            self.add_dependant(
+                build_call_model(
+                    original,
+                    dependency_provider=self,
+                )
             )
 
-        override_model = build_call_model(
-            override,
-            dependency_provider=self,
-            serializer_cls=serializer_cls,
-        )
+        model_key = (key, override, serializer_cls, scope, concurrent)
+        if (override_model := self._override_models.get(model_key)) is None:
+            override_model = self._override_models[model_key] = build_call_model(
+                override,
+                dependency_provider=self,
+                serializer_cls=serializer_cls,
+                scope=scope,
+                concurrent=concurrent,
+            )
 
-        self.overrides[key] = override_model
+        return key, override_model
 
     def __setitem__(
         self,
@@ -82,6 +249,50 @@ class Provider:
         self.override(original, override)
         yield
         self.overrides.pop(self.__get_original_key(original), None)
+        self._invalidate_build_cache()
+        self._bump_epoch()
+
+    @contextmanager
+    def local_scope(
+        self,
+        original: Callable[..., Any],
+        override: Callable[..., Any],
+    ) -> Iterator[None]:
+        """Override the dependency for the current context only.
+
+        The override is visible to the current thread or async task and to the tasks
+        started from it. The override model is built once and reused by the next
+        activations, so entering the scope does not touch the shared provider state.
+        """
+        key, override_model = self._get_override_model(original, override)
+
+        var = self._local_overrides[0]
+        token = var.set({**(var.get() or {}), key: override_model})
+        try:
+            yield
+        finally:
+            var.reset(token)
+
+    def _invalidate_build_cache(self) -> None:
+        # cached models are registered against the overrides state they were built with
+        self.build_cache.clear()
+        for view in tuple(self._views):
+            view._invalidate_build_cache()
+
+    def _bump_epoch(self) -> None:
+        """Drop the resolved table to make models resolve their dependencies again."""
+        self.epoch += 1
+        self._resolved.clear()
+        for view in tuple(self._views):
+            view._bump_epoch()
 
     def __get_original_key(self, original: Callable[..., Any]) -> Key:
         return original
+
+
+def _layers(
+    mapping: MutableMapping[Key, "CallModel"],
+) -> list[MutableMapping[Key, "CallModel"]]:
+    if isinstance(mapping, ChainMap):
+        return mapping.maps
+    return [mapping]
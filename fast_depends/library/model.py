@@ -1,4 +1,5 @@
 from abc import ABC
+from functools import cache
 from typing import Any, TypeVar
 
 Cls = TypeVar("Cls", bound="CustomField")
@@ -27,6 +28,26 @@ class CustomField(ABC):
         self.required = required
         self.field = False
 
+    def clone(self: Cls) -> Cls:
+        """Copy the field to bind it to a parameter.
+
+        The copy is shallow: attribute values are shared with the original field.
+        Override it if the field has mutable state to be separated between parameters.
+        """
+        cls = type(self)
+        field = cls.__new__(cls)
+        for name in _slot_names(cls):
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                # unset slot
+                continue
+            object.__setattr__(field, name, value)
+
+        if (values := getattr(self, "__dict__", None)) is not None:
+            field.__dict__.update(values)
+        return field
+
     def set_param_name(self: Cls, name: str) -> Cls:
         self.param_name = name
         return self
@@ -40,3 +61,24 @@ class CustomField(ABC):
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(required={self.required}, cast={self.cast})"
+
+
+@cache
+def _slot_names(cls: type) -> tuple[str, ...]:
+    names: list[str] = []
+    for base in cls.__mro__:
+        slots = base.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(
+            _mangle(base, i) for i in slots if i not in ("__dict__", "__weakref__")
+        )
+    return tuple(dict.fromkeys(names))
+
+
+def _mangle(cls: type, name: str) -> str:
+    """Attribute name of a `cls` slot, private names are stored mangled."""
+    if name.startswith("__") and not name.endswith("__"):
+        if class_name := cls.__name__.lstrip("_"):
+            return f"_{class_name}{name}"
+    return name
@@ -1,8 +1,13 @@
 import inspect
 import json
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from copy import copy
+from threading import Lock
 from typing import Any, Protocol
 
+from typing_extensions import Self
+
 
 class OptionItem:
     __slots__ = (
@@ -54,13 +59,93 @@ class Serializer(ABC):
     def get_aliases(self) -> tuple[str, ...]:
         return ()
 
+    def with_name(self, name: str) -> Self:
+        """Copy the serializer for another call site of the same signature.
+
+        The copy shares the built validation model, override it to rebuild
+        the parts showing the call name.
+        """
+        serializer = copy(self)
+        serializer.name = name
+        return serializer
+
+    def warmup(self) -> None:
+        """Prepare the serializer to not slow down the first call."""
+        return None
+
     @abstractmethod
     def __call__(self, call_kwargs: dict[str, Any]) -> dict[str, Any]:
         raise NotImplementedError
 
+    def batch(self, calls_kwargs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Validate arguments of many calls at once.
+
+        Override it to validate all of them with a single `list[T]` call.
+        """
+        return [self(call_kwargs) for call_kwargs in calls_kwargs]
+
+    def from_json(self, data: bytes) -> dict[str, Any]:
+        """Decode and validate a JSON object of the call arguments.
+
+        Override it to validate the raw bytes in a single step.
+        """
+        return self(json.loads(data))
+
     def response(self, value: Any) -> Any:
         return value
 
+    def response_batch(self, values: list[Any]) -> list[Any]:
+        """Cast a chunk of generator items at once.
+
+        Override it to validate the whole chunk with a single `list[T]` call.
+        """
+        return [self.response(v) for v in values]
+
+
+class LazySerializer(Serializer):
+    """Serializer built by `factory` on first use."""
+
+    def __init__(
+        self,
+        factory: Callable[[], Serializer],
+        *,
+        name: str,
+        options: list[OptionItem],
+        response_type: Any,
+    ) -> None:
+        super().__init__(name=name, options=options, response_type=response_type)
+        self._factory = factory
+        self._serializer: Serializer | None = None
+        self._lock = Lock()
+
+    def _build(self) -> Serializer:
+        if (serializer := self._serializer) is None:
+            with self._lock:
+                if (serializer := self._serializer) is None:
+                    serializer = self._serializer = self._factory()
+        return serializer
+
+    def warmup(self) -> None:
+        self._build().warmup()
+
+    def get_aliases(self) -> tuple[str, ...]:
+        return self._build().get_aliases()
+
+    def __call__(self, call_kwargs: dict[str, Any]) -> dict[str, Any]:
+        return self._build()(call_kwargs)
+
+    def batch(self, calls_kwargs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return self._build().batch(calls_kwargs)
+
+    def from_json(self, data: bytes) -> dict[str, Any]:
+        return self._build().from_json(data)
+
+    def response(self, value: Any) -> Any:
+        return self._build().response(value)
+
+    def response_batch(self, values: list[Any]) -> list[Any]:
+        return self._build().response_batch(values)
+
 
 class SerializerProto(Protocol):
     def __call__(
@@ -74,3 +159,18 @@ class SerializerProto(Protocol):
     @staticmethod
     def encode(message: Any) -> bytes:
         return json.dumps(message).encode("utf-8")
+
+    @staticmethod
+    def decode(data: bytes) -> Any:
+        return json.loads(data)
+
+    def decode_object(self, data: bytes) -> dict[str, Any]:
+        """Decode a JSON object of call arguments without validating them.
+
+        Override it to raise the serializer validation error for malformed JSON
+        and non-object payloads, the same way `Serializer.from_json` does.
+        """
+        decoded = self.decode(data)
+        if not isinstance(decoded, dict):
+            raise TypeError("JSON payload should be an object")
+        return decoded
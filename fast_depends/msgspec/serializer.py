@@ -65,12 +65,22 @@ class MsgSpecSerializer(SerializerProto):
             return message
         return msgspec.json.encode(message)
 
+    @staticmethod
+    def decode(data: bytes) -> Any:
+        return msgspec.json.decode(data)
+
+    def decode_object(self, data: bytes) -> dict[str, Any]:
+        return msgspec.json.decode(data, type=dict[str, Any])
+
 
 class _MsgSpecSerializer(Serializer):
     __slots__ = (
         "aliases",
         "model",
+        "batch_model",
+        "_json_decoder",
         "response_type",
+        "response_batch_type",
         "name",
         "options",
         "response_option",
@@ -113,6 +123,8 @@ class _MsgSpecSerializer(Serializer):
 
         self.aliases = aliases
         self.model = msgspec.defstruct(name, model_options, kw_only=True)
+        self.batch_model = list[self.model]  # type: ignore[name-defined]
+        self._json_decoder: msgspec.json.Decoder[Any] | None = None
         self.dec_hook = dec_hook
         super().__init__(name=name, options=options, response_type=response_type)
 
@@ -133,6 +145,41 @@ class _MsgSpecSerializer(Serializer):
             for out_field in self.aliases.keys()
         }
 
+    def from_json(self, data: bytes) -> dict[str, Any]:
+        casted_model = self._get_json_decoder().decode(data)
+
+        return {
+            out_field: getattr(casted_model, out_field, None)
+            for out_field in self.aliases.keys()
+        }
+
+    def _get_json_decoder(self) -> "msgspec.json.Decoder[Any]":
+        if (decoder := self._json_decoder) is None:
+            # built on first use to not slow down regular models creation
+            decoder = self._json_decoder = msgspec.json.Decoder(
+                self.model,
+                strict=False,
+                dec_hook=self.dec_hook,
+            )
+        return decoder
+
+    def batch(self, calls_kwargs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        casted_models = msgspec.convert(
+            calls_kwargs,
+            type=self.batch_model,
+            strict=False,
+            str_keys=True,
+            dec_hook=self.dec_hook,
+        )
+
+        return [
+            {
+                out_field: getattr(casted_model, out_field, None)
+                for out_field in self.aliases.keys()
+            }
+            for casted_model in casted_models
+        ]
+
 
 class _MsgSpecSerializerWithResponse(_MsgSpecSerializer):
     def __init__(
@@ -150,6 +197,7 @@ class _MsgSpecSerializerWithResponse(_MsgSpecSerializer):
             dec_hook=dec_hook,
         )
         self.response_type = response_type
+        self.response_batch_type = list[response_type]
 
     def response(self, value: Any) -> Any:
         return msgspec.convert(
@@ -159,6 +207,14 @@ class _MsgSpecSerializerWithResponse(_MsgSpecSerializer):
             dec_hook=self.dec_hook,
         )
 
+    def response_batch(self, values: list[Any]) -> list[Any]:
+        return msgspec.convert(
+            values,
+            type=self.response_batch_type,
+            strict=False,
+            dec_hook=self.dec_hook,
+        )
+
 
 class _MsgSpecWrappedSerializer(_MsgSpecSerializer):
     def __call__(self, call_kwargs: dict[str, Any]) -> dict[str, Any]:
@@ -176,6 +232,15 @@ class _MsgSpecWrappedSerializer(_MsgSpecSerializer):
             for out_field in self.aliases.keys()
         }
 
+    def from_json(self, data: bytes) -> dict[str, Any]:
+        with self._try_msgspec(data, self.options):
+            casted_model = self._get_json_decoder().decode(data)
+
+        return {
+            out_field: getattr(casted_model, out_field, None)
+            for out_field in self.aliases.keys()
+        }
+
     @contextmanager
     def _try_msgspec(
         self,
@@ -185,7 +250,8 @@ class _MsgSpecWrappedSerializer(_MsgSpecSerializer):
     ) -> Iterator[None]:
         try:
             yield
-        except msgspec.ValidationError as er:
+        # `DecodeError` also covers malformed JSON of `from_json`
+        except msgspec.DecodeError as er:
             raise ValidationError(
                 incoming_options=call_kwargs,
                 expected=options,
@@ -210,6 +276,7 @@ class _MsgSpecWrappedSerializerWithResponse(_MsgSpecWrappedSerializer):
             dec_hook=dec_hook,
         )
         self.response_type = response_type
+        self.response_batch_type = list[response_type]
 
     def response(self, value: Any) -> Any:
         with self._try_msgspec(value, self.response_option, ("return",)):
@@ -219,3 +286,12 @@ class _MsgSpecWrappedSerializerWithResponse(_MsgSpecWrappedSerializer):
                 strict=False,
                 dec_hook=self.dec_hook,
             )
+
+    def response_batch(self, values: list[Any]) -> list[Any]:
+        with self._try_msgspec(values, self.response_option, ("return",)):
+            return msgspec.convert(
+                values,
+                type=self.response_batch_type,
+                strict=False,
+                dec_hook=self.dec_hook,
+            )
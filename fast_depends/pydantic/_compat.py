@@ -61,7 +61,8 @@ if PYDANTIC_V2:
     from pydantic import ConfigDict, TypeAdapter
     from pydantic.fields import FieldInfo
     from pydantic.errors import PydanticUserError
-    from pydantic_core import to_json
+    from pydantic_core import SchemaValidator, to_json
+    from pydantic_core.core_schema import CoreConfig
 
     def model_schema(model: type[BaseModel]) -> dict[str, Any]:
         schema: dict[str, Any] = model.model_json_schema()
@@ -86,6 +87,29 @@ if PYDANTIC_V2:
     def dump_json(data: Any) -> bytes:
         return to_json(data)
 
+    def get_model_validator(model: type[BaseModel]) -> Callable[[Any], BaseModel]:
+        # skips `__init__` keywords unpacking
+        return model.__pydantic_validator__.validate_python  # type: ignore[no-any-return]
+
+    def get_model_json_validator(model: type[BaseModel]) -> Callable[[bytes], BaseModel]:
+        return model.__pydantic_validator__.validate_json  # type: ignore[no-any-return]
+
+    def get_model_validators(
+        model: type[BaseModel], title: str
+    ) -> tuple[Callable[[Any], BaseModel], Callable[[bytes], BaseModel]]:
+        """Python and JSON validators of `model` naming errors after `title`."""
+        validator = model.__pydantic_validator__
+        if validator.title != title:
+            # reuses the built core schema, much cheaper than a new model
+            schema = model.__pydantic_core_schema__
+            config: CoreConfig = {**schema.get("config", {}), "title": title}  # type: ignore[typeddict-item]
+            validator = SchemaValidator(schema, config)
+        return validator.validate_python, validator.validate_json
+
+    def get_model_values(model: BaseModel) -> dict[str, Any]:
+        # fields only, extra values are stored at `__pydantic_extra__`
+        return model.__dict__
+
 else:
     from pydantic.config import get_config, ConfigDict, BaseConfig
     from pydantic.fields import ModelField, FieldInfo
@@ -108,3 +132,18 @@ else:
 
     def dump_json(data: Any) -> bytes:
         return json_dumps(data, default=pydantic_encoder)
+
+    def get_model_validator(model: type[BaseModel]) -> Callable[[Any], BaseModel]:
+        return model.validate  # type: ignore[no-any-return]
+
+    def get_model_json_validator(model: type[BaseModel]) -> Callable[[bytes], BaseModel]:
+        return model.parse_raw  # type: ignore[no-any-return]
+
+    def get_model_validators(
+        model: type[BaseModel], title: str
+    ) -> tuple[Callable[[Any], BaseModel], Callable[[bytes], BaseModel]]:
+        # V1 errors are always named after the model
+        return get_model_validator(model), get_model_json_validator(model)
+
+    def get_model_values(model: BaseModel) -> dict[str, Any]:
+        return {i: getattr(model, i) for i in model.__fields__}
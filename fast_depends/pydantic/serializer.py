@@ -1,10 +1,12 @@
 import inspect
 from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
+from functools import cache
 from itertools import chain
 from typing import Any
 
 from pydantic import ValidationError as PValidationError
+from typing_extensions import Self
 
 from fast_depends.exceptions import ValidationError
 from fast_depends.library.serializer import OptionItem, Serializer, SerializerProto
@@ -18,7 +20,11 @@ from fast_depends.pydantic._compat import (
     dump_json,
     get_aliases,
     get_config_base,
-    get_model_fields,
+    get_model_json_validator,
+    get_model_validator,
+    get_model_validators,
+    get_model_values,
+    json_loads,
 )
 
 
@@ -78,6 +84,25 @@ class PydanticSerializer(SerializerProto):
             return message
         return dump_json(message)
 
+    @staticmethod
+    def decode(data: bytes) -> Any:
+        return json_loads(data)
+
+    def decode_object(self, data: bytes) -> dict[str, Any]:
+        if not PYDANTIC_V2:
+            return super().decode_object(data)
+
+        try:
+            decoded = json_loads(data)
+        except ValueError:
+            decoded = None
+
+        if isinstance(decoded, dict):
+            return decoded
+
+        # validated again only to raise the pydantic error for the payload
+        return _get_json_object_validator()(data)
+
 
 class _PydanticSerializer(Serializer):
     __slots__ = (
@@ -86,6 +111,9 @@ class _PydanticSerializer(Serializer):
         "options",
         "config",
         "response_option",
+        "_validate",
+        "_validate_json",
+        "_batch_callback",
     )
 
     def __init__(
@@ -108,21 +136,47 @@ class _PydanticSerializer(Serializer):
             **class_options,
         )
 
+        self._validate = get_model_validator(self.model)
+        self._validate_json = get_model_json_validator(self.model)
+        self._batch_callback: Callable[[Any], Any] | None = None
+
         super().__init__(name=name, options=options, response_type=response_type)
 
+    def with_name(self, name: str) -> Self:
+        serializer = super().with_name(name)
+        serializer._validate, serializer._validate_json = get_model_validators(
+            self.model, name
+        )
+        return serializer
+
     def get_aliases(self) -> tuple[str, ...]:
         return get_aliases(self.model)
 
     def __call__(self, call_kwargs: dict[str, Any]) -> dict[str, Any]:
-        casted_model = self.model(**call_kwargs)
+        return get_model_values(self._validate(call_kwargs))
 
-        return {
-            i: getattr(casted_model, i) for i in get_model_fields(casted_model).keys()
-        }
+    def from_json(self, data: bytes) -> dict[str, Any]:
+        return get_model_values(self._validate_json(data))
+
+    def batch(self, calls_kwargs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if not PYDANTIC_V2:
+            return super().batch(calls_kwargs)
+
+        if (callback := self._batch_callback) is None:
+            # built on first use to not slow down regular models creation
+            callback = self._batch_callback = TypeAdapter(
+                list[self.model]  # type: ignore[name-defined]
+            ).validate_python
+
+        return [get_model_values(casted_model) for casted_model in callback(calls_kwargs)]
 
 
 class _PydanticSerializerWithResponse(_PydanticSerializer):
-    __slots__ = ("response_callback",)
+    __slots__ = (
+        "response_callback",
+        "response_type",
+        "_response_batch_callback",
+    )
 
     response_callback: Callable[[Any], Any]
 
@@ -173,18 +227,40 @@ class _PydanticSerializerWithResponse(_PydanticSerializer):
         assert response_callback
         self.response_callback = response_callback
 
+        self.response_type = response_type
+        self._response_batch_callback: Callable[[Any], Any] | None = None
+
     def response(self, value: Any) -> Any:
         return self.response_callback(value)
 
+    def response_batch(self, values: list[Any]) -> list[Any]:
+        if not PYDANTIC_V2:
+            return super().response_batch(values)
+
+        if (callback := self._response_batch_callback) is None:
+            # built on first use to not slow down regular models creation
+            batch_type = list[self.response_type]  # type: ignore[name-defined]
+            try:
+                batch_pydantic_type = TypeAdapter(batch_type, config=self.config)
+            except PydanticUserError:
+                batch_pydantic_type = TypeAdapter(batch_type)
+            callback = self._response_batch_callback = batch_pydantic_type.validate_python
+
+        return callback(values)  # type: ignore[no-any-return]
+
 
 class _PydanticWrappedSerializer(_PydanticSerializer):
     def __call__(self, call_kwargs: dict[str, Any]) -> dict[str, Any]:
         with self._try_pydantic(call_kwargs, self.options):
-            casted_model = self.model(**call_kwargs)
+            casted_model = self._validate(call_kwargs)
 
-        return {
-            i: getattr(casted_model, i) for i in get_model_fields(casted_model).keys()
-        }
+        return get_model_values(casted_model)
+
+    def from_json(self, data: bytes) -> dict[str, Any]:
+        with self._try_pydantic(data, self.options):
+            casted_model = self._validate_json(data)
+
+        return get_model_values(casted_model)
 
     @contextmanager
     def _try_pydantic(
@@ -212,3 +288,13 @@ class _PydanticWrappedSerializerWithResponse(
     def response(self, value: Any) -> Any:
         with self._try_pydantic(value, self.response_option, ("return",)):
             return self.response_callback(value)
+
+    def response_batch(self, values: list[Any]) -> list[Any]:
+        with self._try_pydantic(values, self.response_option, ("return",)):
+            return super().response_batch(values)
+
+
+@cache
+def _get_json_object_validator() -> Callable[[bytes], dict[str, Any]]:
+    # built on first use to not slow down the module import
+    return TypeAdapter(dict[str, Any]).validate_json  # type: ignore[no-any-return]
@@ -1,6 +1,13 @@
-from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 from contextlib import AsyncExitStack, ExitStack
-from functools import partial, wraps
+from functools import cache, partial, wraps
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -15,32 +22,54 @@ from typing import (
 from typing_extensions import ParamSpec
 
 from fast_depends.core import CallModel, build_call_model
+from fast_depends.core.codegen import generate_injected_wrapper
 from fast_depends.dependencies import Dependant, Provider
-from fast_depends.library.serializer import SerializerProto
 
-SerializerCls: Optional["SerializerProto"] = None
 
-try:
-    from fast_depends.pydantic import PydanticSerializer
+@cache
+def get_default_serializer() -> Optional["SerializerProto"]:
+    """Pick the serializer for the first available validation library.
 
-    SerializerCls = PydanticSerializer()
-except ImportError:
-    pass
+    Is called on the first model build, so `import fast_depends` does not import them.
+    """
+    try:
+        from fast_depends.pydantic import PydanticSerializer
+    except ImportError:
+        pass
+    else:
+        return PydanticSerializer()
 
-if SerializerCls is None:
     try:
         from fast_depends.msgspec import MsgSpecSerializer
-
-        SerializerCls = MsgSpecSerializer()
     except ImportError:
         pass
+    else:
+        return MsgSpecSerializer()
+
+    return None
+
+
+# placeholder for the `get_default_serializer()` result at `inject` signatures
+DEFAULT_SERIALIZER: Any = object()
+
+
+def __getattr__(name: str) -> Any:
+    if name == "SerializerCls":
+        return get_default_serializer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
 if TYPE_CHECKING:
+    from fast_depends.dependencies import Memoize
+    from fast_depends.dependencies.model import Execution, Scope
     from fast_depends.library.serializer import SerializerProto
+    from fast_depends.utils import ThreadPool
+
+    # resolved lazily by the module `__getattr__`
+    SerializerCls: SerializerProto | None
 
     class InjectWrapper(Protocol[P, T]):
         def __call__(
@@ -59,12 +88,22 @@ def Depends(
     use_cache: bool = True,
     cast: bool = True,
     cast_result: bool = False,
+    scope: "Scope" = "call",
+    memoize: Union[bool, "Memoize"] = False,
+    coalesce: bool = False,
+    execution: "Execution" = "default",
+    thread_pool: Union[str, "ThreadPool", None] = None,
 ) -> Any:
     return Dependant(
         dependency=dependency,
         use_cache=use_cache,
         cast=cast,
         cast_result=cast_result,
+        scope=scope,
+        memoize=memoize,
+        coalesce=coalesce,
+        execution=execution,
+        thread_pool=thread_pool,
     )
 
 
@@ -77,7 +116,13 @@ def inject(
     extra_dependencies: Sequence["Dependant"] = (),
     dependency_provider: Optional["Provider"] = None,
     wrap_model: Callable[["CallModel"], "CallModel"] = lambda x: x,
-    serializer_cls: Optional["SerializerProto"] = SerializerCls,
+    serializer_cls: Optional["SerializerProto"] = DEFAULT_SERIALIZER,
+    concurrent: bool = False,
+    codegen: bool = False,
+    execution: "Execution" = "default",
+    thread_pool: Union[str, "ThreadPool", None] = None,
+    stream_batch_size: int | None = None,
+    lazy_serializer: bool = False,
     **call_extra: Any,
 ) -> Callable[P, T]: ...
 
@@ -91,7 +136,13 @@ def inject(
     extra_dependencies: Sequence["Dependant"] = (),
     dependency_provider: Optional["Provider"] = None,
     wrap_model: Callable[["CallModel"], "CallModel"] = lambda x: x,
-    serializer_cls: Optional["SerializerProto"] = SerializerCls,
+    serializer_cls: Optional["SerializerProto"] = DEFAULT_SERIALIZER,
+    concurrent: bool = False,
+    codegen: bool = False,
+    execution: "Execution" = "default",
+    thread_pool: Union[str, "ThreadPool", None] = None,
+    stream_batch_size: int | None = None,
+    lazy_serializer: bool = False,
     **call_extra: Any,
 ) -> "InjectWrapper[..., Any]": ...
 
@@ -104,7 +155,13 @@ def inject(
     extra_dependencies: Sequence[Dependant] = (),
     dependency_provider: Optional["Provider"] = None,
     wrap_model: Callable[["CallModel"], "CallModel"] = lambda x: x,
-    serializer_cls: Optional["SerializerProto"] = SerializerCls,
+    serializer_cls: Optional["SerializerProto"] = DEFAULT_SERIALIZER,
+    concurrent: bool = False,
+    codegen: bool = False,
+    execution: "Execution" = "default",
+    thread_pool: Union[str, "ThreadPool", None] = None,
+    stream_batch_size: int | None = None,
+    lazy_serializer: bool = False,
     **call_extra: Any,
 ) -> Union[Callable[P, T], "InjectWrapper[P, T]"]:
     if dependency_provider is None:
@@ -119,6 +176,12 @@ def inject(
         extra_dependencies=extra_dependencies,
         serializer_cls=serializer_cls,
         cast_result=cast_result,
+        concurrent=concurrent,
+        codegen=codegen,
+        execution=execution,
+        thread_pool=thread_pool,
+        stream_batch_size=stream_batch_size,
+        lazy_serializer=lazy_serializer,
         **call_extra,
     )
 
@@ -134,6 +197,12 @@ def _wrap_inject(
     extra_dependencies: Sequence[Dependant],
     serializer_cls: Optional["SerializerProto"],
     cast_result: bool,
+    concurrent: bool,
+    codegen: bool,
+    execution: "Execution",
+    thread_pool: Union[str, "ThreadPool", None],
+    stream_batch_size: int | None,
+    lazy_serializer: bool,
     **call_extra: Any,
 ) -> "InjectWrapper[P, T]":
     def func_wrapper(
@@ -146,16 +215,30 @@ def _wrap_inject(
                     call=func,
                     extra_dependencies=extra_dependencies,
                     dependency_provider=dependency_provider,
-                    serializer_cls=serializer_cls,
+                    serializer_cls=get_default_serializer()
+                    if serializer_cls is DEFAULT_SERIALIZER
+                    else serializer_cls,
                     serialize_result=cast_result,
+                    concurrent=concurrent,
+                    execution=execution,
+                    thread_pool=thread_pool,
+                    stream_batch_size=stream_batch_size,
+                    lazy_serializer=lazy_serializer,
                 )
             )
         else:
             real_model = model
 
-        if real_model.is_async:
-            injected_wrapper: Callable[P, T]
+        injected_wrapper: Callable[P, T]
+
+        generated_wrapper = (
+            generate_injected_wrapper(real_model, call_extra) if codegen else None
+        )
+
+        if generated_wrapper is not None:
+            injected_wrapper = generated_wrapper
 
+        elif real_model.is_async:
             if real_model.is_generator:
                 injected_wrapper = partial(  # type: ignore[assignment]
                     solve_async_gen,
@@ -165,6 +248,16 @@ def _wrap_inject(
             else:
 
                 async def injected_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:  # type: ignore[misc]
+                    if not real_model.needs_stack():
+                        # nothing is pushed to the stack without generator dependencies
+                        return await real_model.asolve(  # type: ignore[no-any-return]
+                            *args,
+                            stack=None,
+                            cache_dependencies={},
+                            nested=False,
+                            **(call_extra | kwargs),
+                        )
+
                     async with AsyncExitStack() as stack:
                         return await real_model.asolve(  # type: ignore[no-any-return]
                             *args,
@@ -186,6 +279,15 @@ def _wrap_inject(
             else:
 
                 def injected_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                    if not real_model.needs_stack():
+                        return real_model.solve(  # type: ignore[no-any-return]
+                            *args,
+                            stack=None,
+                            cache_dependencies={},
+                            nested=False,
+                            **(call_extra | kwargs),
+                        )
+
                     with ExitStack() as stack:
                         return real_model.solve(  # type: ignore[no-any-return]
                             *args,
@@ -198,11 +300,95 @@ def _wrap_inject(
                     raise AssertionError("unreachable")
 
         injected_wrapper._fastdepends_call_ = real_model.call  # type: ignore[attr-defined]
+        injected_wrapper.warmup = real_model.warmup  # type: ignore[attr-defined]
+        if not real_model.is_generator:
+            injected_wrapper.batch = _build_batch(real_model, call_extra)  # type: ignore[attr-defined]
+            injected_wrapper.from_json = _build_from_json(real_model, call_extra)  # type: ignore[attr-defined]
         return wraps(func)(injected_wrapper)
 
     return func_wrapper
 
 
+def _build_batch(
+    model: "CallModel",
+    call_extra: dict[str, Any],
+) -> Callable[[Iterable[Mapping[str, Any]]], Any]:
+    """Make `injected.batch(items)` to solve a call for many keyword arguments at once."""
+    if model.is_async:
+
+        async def async_batch(items: Iterable[Mapping[str, Any]]) -> list[Any]:
+            async with AsyncExitStack() as stack:
+                return await model.asolve_batch(
+                    [call_extra | dict(item) for item in items],
+                    stack=stack,
+                )
+
+            raise AssertionError("unreachable")
+
+        return async_batch
+
+    def batch(items: Iterable[Mapping[str, Any]]) -> list[Any]:
+        with ExitStack() as stack:
+            return model.solve_batch(
+                [call_extra | dict(item) for item in items],
+                stack=stack,
+            )
+
+        raise AssertionError("unreachable")
+
+    return batch
+
+
+def _build_from_json(
+    model: "CallModel",
+    call_extra: dict[str, Any],
+) -> Callable[[bytes], Any]:
+    """Make `injected.from_json(data)` to solve a call with a raw JSON payload."""
+    if model.is_async:
+
+        async def async_from_json(data: bytes) -> Any:
+            if not model.needs_stack():
+                return await model.asolve_json(
+                    data,
+                    stack=None,
+                    cache_dependencies={},
+                    **call_extra,
+                )
+
+            async with AsyncExitStack() as stack:
+                return await model.asolve_json(
+                    data,
+                    stack=stack,
+                    cache_dependencies={},
+                    **call_extra,
+                )
+
+            raise AssertionError("unreachable")
+
+        return async_from_json
+
+    def from_json(data: bytes) -> Any:
+        if not model.needs_stack():
+            return model.solve_json(
+                data,
+                stack=None,
+                cache_dependencies={},
+                **call_extra,
+            )
+
+        with ExitStack() as stack:
+            return model.solve_json(
+                data,
+                stack=stack,
+                cache_dependencies={},
+                **call_extra,
+            )
+
+        raise AssertionError("unreachable")
+
+    return from_json
+
+
 class solve_async_gen:
     _iter: AsyncIterator[Any] | None = None
 
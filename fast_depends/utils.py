@@ -1,7 +1,16 @@
+import contextvars
 import functools
 import inspect
 import sys
-from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+)
+from concurrent.futures import Executor
 from contextlib import (
     AbstractContextManager,
     AsyncExitStack,
@@ -9,12 +18,15 @@ from contextlib import (
     asynccontextmanager,
     contextmanager,
 )
+from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Annotated,
     Any,
     ForwardRef,
+    TypeAlias,
     TypeVar,
+    Union,
     cast,
     get_args,
     get_origin,
@@ -26,7 +38,6 @@ if sys.version_info >= (3, 12):
 else:
     from typing_extensions import TypeAliasType
 
-import anyio
 from typing_extensions import ParamSpec
 
 from fast_depends._compat import evaluate_forwardref
@@ -34,9 +45,13 @@ from fast_depends._compat import evaluate_forwardref
 if TYPE_CHECKING:
     from types import FrameType
 
+    import anyio
+
 P = ParamSpec("P")
 T = TypeVar("T")
 
+ThreadPool: TypeAlias = Union["anyio.CapacityLimiter", Executor]
+
 
 async def run_async(
     func: Callable[P, T] | Callable[P, Awaitable[T]],
@@ -54,11 +69,41 @@ async def run_in_threadpool(
     *args: P.args,
     **kwargs: P.kwargs,
 ) -> T:
+    import anyio
+
     if kwargs:
         func = functools.partial(func, **kwargs)
     return await anyio.to_thread.run_sync(func, *args)
 
 
+async def run_in_pool(
+    pool: ThreadPool | None,
+    func: Callable[..., T],
+    /,
+    *args: Any,
+) -> T:
+    """Run a blocking function at the specified capacity limiter or executor."""
+    import anyio
+
+    if pool is None:
+        return await anyio.to_thread.run_sync(func, *args)
+
+    if not isinstance(pool, Executor):
+        return await anyio.to_thread.run_sync(func, *args, limiter=pool)
+
+    import asyncio
+
+    # the same way as `to_thread.run_sync`, the worker sees the caller context
+    future = pool.submit(contextvars.copy_context().run, func, *args)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # not an asyncio backend, so wait for the result in the default threadpool
+        return await anyio.to_thread.run_sync(future.result)
+    else:
+        return await asyncio.wrap_future(future)
+
+
 async def solve_generator_async(
     *sub_args: Any,
     call: Callable[..., Any],
@@ -85,7 +130,19 @@ def solve_generator_sync(
 def get_typed_signature(call: Callable[..., Any]) -> tuple[inspect.Signature, Any]:
     signature = inspect.signature(call)
 
-    locals = collect_outer_stack_locals()
+    # walking the stack is expensive, so do it only if there is something to resolve
+    if any(
+        map(
+            has_forward_refs,
+            (
+                *(param.annotation for param in signature.parameters.values()),
+                signature.return_annotation,
+            ),
+        )
+    ):
+        locals = collect_outer_stack_locals()
+    else:
+        locals = {}
 
     # We unwrap call to get the original unwrapped function
     call = inspect.unwrap(call)
@@ -116,6 +173,19 @@ def get_typed_signature(call: Callable[..., Any]) -> tuple[inspect.Signature, An
     )
 
 
+def has_forward_refs(annotation: Any) -> bool:
+    """Check the annotation has references `get_typed_annotation` evaluates."""
+    if isinstance(annotation, TypeAliasType):
+        annotation = annotation.__value__
+
+    if isinstance(annotation, str | ForwardRef):
+        return True
+
+    return get_origin(annotation) is Annotated and any(
+        map(has_forward_refs, get_args(annotation))
+    )
+
+
 def collect_outer_stack_locals() -> dict[str, Any]:
     frame = inspect.currentframe()
 
@@ -166,22 +236,21 @@ def get_typed_annotation(
 @asynccontextmanager
 async def contextmanager_in_threadpool(
     cm: AbstractContextManager[T],
+    pool: ThreadPool | None = None,
 ) -> AsyncGenerator[T, None]:
-    exit_limiter = anyio.CapacityLimiter(1)
+    import anyio
+
+    # exit should not wait for the capacity exhausted by other enters,
+    # executor workers included: they may be blocked by the resource to release
+    exit_pool = anyio.CapacityLimiter(1)
     try:
-        yield await run_in_threadpool(cm.__enter__)
+        yield await run_in_pool(pool, cm.__enter__)
     except Exception as e:
-        ok = bool(
-            await anyio.to_thread.run_sync(
-                cm.__exit__, type(e), e, None, limiter=exit_limiter
-            )
-        )
+        ok = bool(await run_in_pool(exit_pool, cm.__exit__, type(e), e, None))
         if not ok:  # pragma: no branch
             raise e
     else:
-        await anyio.to_thread.run_sync(
-            cm.__exit__, None, None, None, limiter=exit_limiter
-        )
+        await run_in_pool(exit_pool, cm.__exit__, None, None, None)
 
 
 def is_gen_callable(call: Callable[..., Any]) -> bool:
@@ -214,3 +283,30 @@ async def async_map(
 ) -> AsyncIterable[T]:
     async for i in async_iterable:
         yield func(i)
+
+
+def batch_map(
+    func: Callable[[list[Any]], Iterable[T]],
+    iterable: Iterable[Any],
+    size: int,
+) -> Iterator[T]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield from func(chunk)
+
+
+async def async_batch_map(
+    func: Callable[[list[Any]], Iterable[T]],
+    async_iterable: AsyncIterable[Any],
+    size: int,
+) -> AsyncIterable[T]:
+    chunk: list[Any] = []
+    async for i in async_iterable:
+        chunk.append(i)
+        if len(chunk) >= size:
+            for r in func(chunk):
+                yield r
+            chunk = []
+
+    for r in func(chunk) if chunk else ():
+        yield r
@@ -0,0 +1,100 @@
+from unittest.mock import Mock
+
+import anyio
+import pytest
+
+from fast_depends import Depends, Provider, inject
+
+
+@pytest.mark.anyio
+async def test_coalesce_concurrent_calls(provider: Provider) -> None:
+    mock = Mock()
+
+    async def dep(a: int) -> int:
+        mock(a)
+        await anyio.sleep(0.01)
+        return a * 2
+
+    @inject(dependency_provider=provider)
+    async def func(a: int, d: int = Depends(dep, coalesce=True)) -> int:
+        return d
+
+    results: list[int] = []
+
+    async def call(a: int) -> None:
+        results.append(await func(a))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(call, 1)
+        tg.start_soon(call, 2)
+
+    assert sorted(results) == [2, 2, 2, 2, 2, 4]
+    assert mock.call_count == 2
+
+    # no cache between calls
+    assert await func(1) == 2
+    assert mock.call_count == 3
+
+
+@pytest.mark.anyio
+async def test_coalesce_shares_errors(provider: Provider) -> None:
+    mock = Mock()
+
+    async def dep() -> int:
+        mock()
+        await anyio.sleep(0.01)
+        raise ValueError("failed")
+
+    @inject(dependency_provider=provider)
+    async def func(d: int = Depends(dep, coalesce=True)) -> int:
+        return d
+
+    errors: list[Exception] = []
+
+    async def call() -> None:
+        try:
+            await func()
+        except ValueError as e:
+            errors.append(e)
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(call)
+
+    assert len(errors) == 3
+    mock.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_coalesce_owner_cancelled(provider: Provider) -> None:
+    started = anyio.Event()
+
+    async def dep() -> int:
+        started.set()
+        await anyio.sleep(0.05)
+        return 1
+
+    @inject(dependency_provider=provider)
+    async def func(d: int = Depends(dep, coalesce=True)) -> int:
+        return d
+
+    results: list[int] = []
+    owner_scope = anyio.CancelScope()
+
+    async def owner() -> None:
+        with owner_scope:
+            results.append(await func())
+
+    async def waiter() -> None:
+        results.append(await func())
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(owner)
+        await started.wait()
+        tg.start_soon(waiter)
+        await anyio.sleep(0)
+        owner_scope.cancel()
+
+    # waiter makes the call itself instead of being cancelled with the owner
+    assert results == [1]
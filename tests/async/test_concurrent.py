@@ -0,0 +1,171 @@
+from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
+from typing import Any
+from unittest.mock import Mock
+
+import anyio
+import pytest
+
+from fast_depends import Depends, Provider, inject
+from fast_depends.core import CallModel, build_call_model
+
+
+@pytest.mark.anyio
+async def test_independent_dependencies_run_concurrently() -> None:
+    first_started = anyio.Event()
+
+    async def first() -> int:
+        first_started.set()
+        return 1
+
+    async def second() -> int:
+        # deadlocks if dependencies are solved one by one in reverse order
+        await first_started.wait()
+        return 2
+
+    @inject(concurrent=True)
+    async def handler(b: int = Depends(second), a: int = Depends(first)) -> int:
+        return a + b
+
+    with anyio.fail_after(1):
+        assert await handler() == 3
+
+
+@pytest.mark.anyio
+async def test_concurrent_dependencies_share_cache() -> None:
+    mock = Mock()
+
+    async def shared() -> int:
+        mock()
+        await anyio.sleep(0.01)
+        return 1
+
+    async def first(s: int = Depends(shared)) -> int:
+        return s
+
+    async def second(s: int = Depends(shared)) -> int:
+        return s + 1
+
+    @inject(concurrent=True)
+    async def handler(a: int = Depends(first), b: int = Depends(second)) -> int:
+        return a + b
+
+    assert await handler() == 3
+    mock.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_dependent_siblings_are_ordered() -> None:
+    async def first() -> int:
+        await anyio.sleep(0.01)
+        return 1
+
+    async def second(a: int) -> int:
+        return a + 1
+
+    @inject(concurrent=True)
+    async def handler(a: int = Depends(first), b: int = Depends(second)) -> int:
+        return b
+
+    assert await handler() == 2
+
+
+@pytest.mark.anyio
+async def test_concurrent_failure_cancels_siblings() -> None:
+    mock = Mock()
+
+    async def failing() -> int:
+        raise ValueError("failed")
+
+    async def slow() -> int:
+        await anyio.sleep(1)
+        mock()
+        return 1
+
+    @inject(concurrent=True)
+    async def handler(a: int = Depends(slow), b: int = Depends(failing)) -> int:
+        raise AssertionError("unreachable")
+
+    with anyio.fail_after(0.5), pytest.raises(ValueError, match="failed"):
+        await handler()
+
+    assert not mock.called
+
+
+@pytest.mark.anyio
+async def test_generator_dependencies_solved_in_caller_task() -> None:
+    mock = Mock()
+
+    async def gen() -> AsyncGenerator[int, None]:
+        mock.enter()
+        yield 1
+        mock.exit()
+
+    async def plain() -> int:
+        return 2
+
+    @inject(concurrent=True)
+    async def handler(a: int = Depends(gen), b: int = Depends(plain)) -> int:
+        return a + b
+
+    assert await handler() == 3
+    mock.enter.assert_called_once()
+    mock.exit.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_sequential_call_does_not_cache_placeholders() -> None:
+    cache: dict[int, object] = {}
+    seen: list[dict[int, object]] = []
+
+    async def dep() -> int:
+        seen.append(dict(cache))
+        return 1
+
+    async def handler(a: int = Depends(dep)) -> int:
+        return a
+
+    model = build_call_model(handler, dependency_provider=Provider())
+    async with AsyncExitStack() as stack:
+        assert await model.asolve(stack=stack, cache_dependencies=cache) == 1
+
+    # placeholders are only needed to share values between concurrent siblings
+    assert seen == [{}]
+
+
+@pytest.mark.anyio
+async def test_subtree_inspected_once_per_epoch(monkeypatch: pytest.MonkeyPatch) -> None:
+    inspect_subtree = Mock()
+    original = CallModel._inspect_subtree
+
+    def counting(self: CallModel, provider: Provider) -> Any:
+        inspect_subtree()
+        return original(self, provider)
+
+    monkeypatch.setattr(CallModel, "_inspect_subtree", counting)
+
+    async def leaf() -> int:
+        return 1
+
+    async def override_leaf() -> int:
+        return 2
+
+    async def mid(a: int = Depends(leaf)) -> int:
+        return a
+
+    provider = Provider()
+
+    @inject(concurrent=True, dependency_provider=provider)
+    async def handler(a: int = Depends(mid), b: int = Depends(leaf)) -> int:
+        return a + b
+
+    assert await handler() == 2
+    inspected = inspect_subtree.call_count
+    assert inspected
+
+    assert await handler() == 2
+    assert inspect_subtree.call_count == inspected
+
+    provider.override(leaf, override_leaf)
+    assert await handler() == 4
+    assert inspect_subtree.call_count > inspected
@@ -0,0 +1,61 @@
+import threading
+from collections.abc import Generator
+
+import pytest
+
+from fast_depends import Depends, inject
+
+
+def thread_id() -> int:
+    return threading.get_ident()
+
+
+def thread_id_gen() -> Generator[int, None, None]:
+    yield threading.get_ident()
+
+
+@pytest.mark.anyio
+async def test_default_execution_in_threadpool() -> None:
+    @inject
+    async def func(t: int = Depends(thread_id)) -> int:
+        return t
+
+    assert await func() != threading.get_ident()
+
+
+@pytest.mark.anyio
+async def test_inline_dependency() -> None:
+    @inject
+    async def func(
+        t: int = Depends(thread_id, execution="inline"),
+        g: int = Depends(thread_id_gen, execution="inline"),
+    ) -> tuple[int, int]:
+        return t, g
+
+    assert await func() == (threading.get_ident(), threading.get_ident())
+
+
+@pytest.mark.anyio
+async def test_inject_execution_default() -> None:
+    @inject(execution="inline")
+    async def func(
+        t: int = Depends(thread_id),
+        g: int = Depends(thread_id_gen, execution="thread"),
+    ) -> tuple[int, int]:
+        return t, g
+
+    t, g = await func()
+    assert t == threading.get_ident()
+    assert g != threading.get_ident()
+
+
+@pytest.mark.anyio
+async def test_inline_execution_inherited_by_nested() -> None:
+    def nested(t: int = Depends(thread_id)) -> int:
+        return t
+
+    @inject
+    async def func(t: int = Depends(nested, execution="inline")) -> int:
+        return t
+
+    assert await func() == threading.get_ident()
@@ -0,0 +1,147 @@
+import time
+from contextlib import AsyncExitStack
+from unittest.mock import Mock
+
+import anyio
+import pytest
+
+from fast_depends import Depends, Provider, inject
+from fast_depends.core import build_call_model, model
+from fast_depends.utils import run_in_pool
+
+
+@pytest.fixture
+def pool_calls(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    mock = Mock()
+
+    async def counted_run_in_pool(*args, **kwargs):
+        mock()
+        return await run_in_pool(*args, **kwargs)
+
+    monkeypatch.setattr(model, "run_in_pool", counted_run_in_pool)
+    return mock
+
+
+@pytest.mark.anyio
+async def test_sync_subtrees_solved_in_single_hop(pool_calls: Mock) -> None:
+    def base() -> int:
+        return 1
+
+    def first(b: int = Depends(base)) -> int:
+        return b + 1
+
+    def second(b: int = Depends(base), a: int = Depends(first)) -> int:
+        return a + b
+
+    @inject
+    async def func(a: int = Depends(first), b: int = Depends(second)) -> int:
+        return a + b
+
+    assert await func() == 5
+    assert pool_calls.call_count == 1
+
+
+@pytest.mark.anyio
+async def test_async_dependency_splits_batch(pool_calls: Mock) -> None:
+    def sync_dep() -> int:
+        return 1
+
+    async def async_dep(a: int) -> int:
+        return a + 1
+
+    @inject
+    async def func(
+        a: int = Depends(sync_dep),
+        b: int = Depends(async_dep),
+        c: int = Depends(sync_dep, use_cache=False),
+    ) -> tuple[int, int, int]:
+        return a, b, c
+
+    assert await func() == (1, 2, 1)
+    assert pool_calls.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_inline_dependency_not_batched(pool_calls: Mock) -> None:
+    def dep() -> int:
+        return 1
+
+    @inject
+    async def func(
+        a: int = Depends(dep, execution="inline"),
+        b: int = Depends(dep, use_cache=False),
+    ) -> int:
+        return a + b
+
+    assert await func() == 2
+    assert pool_calls.call_count == 1
+
+
+@pytest.mark.anyio
+async def test_batch_waits_for_concurrent_sibling(provider: Provider) -> None:
+    mock = Mock()
+
+    def shared() -> str:
+        mock()
+        time.sleep(0.05)
+        return "S"
+
+    async def first(x: str = Depends(shared)) -> str:
+        return x
+
+    async def original() -> str:
+        raise NotImplementedError
+
+    async def delay() -> None:
+        # let the concurrent sibling start solving `shared` first
+        await anyio.sleep(0.01)
+
+    # override models are not concurrent, so they batch their sync subtrees
+    async def override(d: None = Depends(delay), x: str = Depends(shared)) -> str:
+        return x
+
+    provider.override(original, override)
+
+    @inject(dependency_provider=provider, concurrent=True)
+    async def handler(
+        a: str = Depends(first), b: str = Depends(original)
+    ) -> tuple[str, str]:
+        return a, b
+
+    assert await handler() == ("S", "S")
+    mock.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_batch_stops_at_pending_value(provider: Provider) -> None:
+    mock = Mock()
+
+    def shared() -> str:
+        mock()
+        return "own"
+
+    def dep(x: str = Depends(shared)) -> str:
+        return x
+
+    async def handler(d: str = Depends(dep)) -> str:
+        return d
+
+    call_model = build_call_model(handler, dependency_provider=provider)
+
+    # the value is being solved by a concurrent task
+    pending = model._PendingResult()
+    cache = {provider.dependencies[shared].cache_slot: pending}
+    results = []
+
+    async def solve() -> None:
+        async with AsyncExitStack() as stack:
+            results.append(await call_model.asolve(stack=stack, cache_dependencies=cache))
+
+    with anyio.fail_after(1):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(solve)
+            await anyio.sleep(0.05)
+            pending.set_result("S")
+
+    assert results == ["S"]
+    mock.assert_not_called()
@@ -0,0 +1,122 @@
+import threading
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+
+import anyio
+import pytest
+
+from fast_depends import Depends, Provider, inject
+
+
+def thread_name() -> str:
+    return threading.current_thread().name
+
+
+def thread_name_gen() -> Generator[str, None, None]:
+    yield threading.current_thread().name
+
+
+@pytest.mark.anyio
+async def test_executor_dependency() -> None:
+    with ThreadPoolExecutor(thread_name_prefix="custom-pool") as executor:
+
+        @inject
+        async def func(
+            name: str = Depends(thread_name, thread_pool=executor),
+            gen_name: str = Depends(thread_name_gen, thread_pool=executor),
+        ) -> tuple[str, str]:
+            return name, gen_name
+
+        name, gen_name = await func()
+
+    assert name.startswith("custom-pool")
+    assert gen_name.startswith("custom-pool")
+
+
+@pytest.mark.anyio
+async def test_executor_keeps_context() -> None:
+    var: ContextVar[str] = ContextVar("var", default="unset")
+
+    def original() -> str:
+        return "original"
+
+    def override() -> str:
+        return "override"
+
+    def mid(o: str = Depends(original)) -> str:
+        return f"{var.get()}-{o}"
+
+    with ThreadPoolExecutor() as executor:
+        provider = Provider(thread_pools={"p": executor}, default_thread_pool="p")
+
+        @inject(dependency_provider=provider)
+        async def handler(m: str = Depends(mid)) -> str:
+            return m
+
+        var.set("set")
+        with provider.local_scope(original, override):
+            assert await handler() == "set-override"
+
+        assert await handler() == "set-original"
+
+
+@pytest.mark.anyio
+async def test_named_limiter() -> None:
+    limiter = anyio.CapacityLimiter(1)
+    provider = Provider(thread_pools={"fs": limiter})
+
+    def dep() -> float:
+        return limiter.borrowed_tokens
+
+    @inject(dependency_provider=provider, thread_pool="fs")
+    async def func(d: float = Depends(dep)) -> float:
+        return d
+
+    assert await func() == 1
+    assert limiter.borrowed_tokens == 0
+
+
+@pytest.mark.anyio
+async def test_provider_default_thread_pool() -> None:
+    with ThreadPoolExecutor(thread_name_prefix="default-pool") as executor:
+        provider = Provider(default_thread_pool=executor)
+
+        @inject(dependency_provider=provider)
+        async def func(name: str = Depends(thread_name)) -> str:
+            return name
+
+        assert (await func()).startswith("default-pool")
+
+
+@pytest.mark.anyio
+async def test_unknown_thread_pool(provider: Provider) -> None:
+    @inject(dependency_provider=provider)
+    async def func(name: str = Depends(thread_name, thread_pool="unknown")) -> str:
+        return name
+
+    with pytest.raises(KeyError, match="unknown"):
+        await func()
+
+
+@pytest.mark.anyio
+async def test_executor_generator_exit_does_not_wait_for_enters() -> None:
+    semaphore = threading.Semaphore(1)
+
+    def resource() -> Generator[None, None, None]:
+        assert semaphore.acquire(timeout=2), "deadlock"
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    with ThreadPoolExecutor(1) as executor:
+
+        @inject
+        async def func(r: None = Depends(resource, thread_pool=executor)) -> None:
+            await anyio.sleep(0.01)
+
+        with anyio.fail_after(3):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(func)
+                tg.start_soon(func)
@@ -98,6 +98,71 @@ def test_reusable_annotated() -> None:
     assert sync_catch2(headers={"key2": 1}) == 1
 
 
+def test_clone_is_shallow() -> None:
+    class SlotsHeader(Header):
+        __slots__ = ("default",)
+
+        def __init__(self, default: Any) -> None:
+            super().__init__()
+            self.default = default
+
+    default = {"key": [1]}
+    field = SlotsHeader(default)
+    field.extra = 1  # type: ignore[attr-defined]
+
+    clone = field.clone()
+
+    assert clone is not field
+    assert type(clone) is SlotsHeader
+    assert clone.default is default
+    assert clone.extra == 1  # type: ignore[attr-defined]
+    assert (clone.cast, clone.required, clone.field) == (True, True, False)
+
+    clone.set_param_name("key")
+    assert field.param_name is None
+
+
+def test_clone_private_slots() -> None:
+    class PrivateHeader(Header):
+        __slots__ = ("__secret",)
+
+        def __init__(self, secret: str) -> None:
+            super().__init__()
+            self.__secret = secret
+
+        @property
+        def secret(self) -> str:
+            return self.__secret
+
+    clone = PrivateHeader("value").clone()
+
+    assert clone.secret == "value"
+
+
+def test_clone_override() -> None:
+    clones: list[CustomField] = []
+
+    class TrackedHeader(Header):
+        def clone(self) -> "TrackedHeader":
+            field = super().clone()
+            clones.append(field)
+            return field
+
+    HeaderKey = Annotated[int, TrackedHeader()]
+
+    @inject
+    def func(key: HeaderKey) -> int:
+        return key
+
+    @inject
+    def func2(key2: HeaderKey) -> int:
+        return key2
+
+    assert [i.param_name for i in clones] == ["key", "key2"]
+    assert func(headers={"key": 1}) == 1
+    assert func2(headers={"key2": 2}) == 2
+
+
 def test_arguments_mapping():
     @inject
     def func(
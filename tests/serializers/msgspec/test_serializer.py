@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 import msgspec
 import pytest
 
@@ -97,3 +99,49 @@ def test_field_alias(serializer: MsgSpecSerializer) -> None:
         return a, d
 
     assert func(aliasedA="1", nestedAlias="2") == (1, 2)
+
+
+@pytest.mark.parametrize(
+    "serializer",
+    (
+        pytest.param(MsgSpecSerializer(use_fastdepends_errors=True), id="wrapped"),
+        pytest.param(MsgSpecSerializer(use_fastdepends_errors=False), id="native"),
+    ),
+)
+def test_response_stream(serializer: MsgSpecSerializer) -> None:
+    @inject(
+        serializer_cls=serializer,
+        dependency_provider=Provider(),
+        stream_batch_size=2,
+    )
+    def func() -> Iterator[float]:
+        yield from range(3)
+
+    assert list(func()) == [0.0, 1.0, 2.0]
+
+
+def test_batch() -> None:
+    @inject(serializer_cls=MsgSpecSerializer(), dependency_provider=Provider())
+    def func(a: int, b: float = 1.0) -> float:
+        return a + b
+
+    result = func.batch([{"a": "1"}, {"a": "x"}, {"a": 2, "b": "0.5"}])
+
+    assert result[0] == 2.0
+    assert isinstance(result[1], ValidationError)
+    assert result[2] == 2.5
+
+
+@pytest.mark.parametrize(
+    "serializer",
+    (
+        pytest.param(MsgSpecSerializer(use_fastdepends_errors=True), id="wrapped"),
+        pytest.param(MsgSpecSerializer(use_fastdepends_errors=False), id="native"),
+    ),
+)
+def test_from_json(serializer: MsgSpecSerializer) -> None:
+    @inject(serializer_cls=serializer, dependency_provider=Provider())
+    def func(a: int, b: float = 1.0) -> float:
+        return a + b
+
+    assert func.from_json(b'{"a": "1", "b": 0.5}') == 1.5
@@ -1,3 +1,7 @@
+from collections.abc import Iterator
+
+from pydantic import BaseModel
+
 from fast_depends import Provider, inject
 from fast_depends.pydantic import PydanticSerializer
 
@@ -18,3 +22,35 @@ def test_non_class_response_type() -> None:
         return a
 
     assert func("1") == 1
+
+
+def test_model_response_stream() -> None:
+    class Item(BaseModel):
+        a: int
+
+    @inject(
+        serializer_cls=PydanticSerializer(),
+        dependency_provider=Provider(),
+        stream_batch_size=2,
+    )
+    def func() -> Iterator[Item]:
+        for i in range(3):
+            yield {"a": str(i)}
+
+    assert list(func()) == [Item(a=0), Item(a=1), Item(a=2)]
+
+
+def test_batch() -> None:
+    @inject(serializer_cls=PydanticSerializer(), dependency_provider=Provider())
+    def func(a: int, b: float = 1.0) -> float:
+        return a + b
+
+    assert func.batch([{"a": "1"}, {"a": 2, "b": "0.5"}]) == [2.0, 2.5]
+
+
+def test_from_json() -> None:
+    @inject(serializer_cls=PydanticSerializer(), dependency_provider=Provider())
+    def func(a: int, b: float = 1.0) -> float:
+        return a + b
+
+    assert func.from_json(b'{"a": "1", "b": 0.5}') == 1.5
@@ -0,0 +1,121 @@
+import pytest
+
+from fast_depends import Depends, Provider
+from fast_depends.core import build_call_model
+from fast_depends.use import SerializerCls
+from tests.marks import pydanticV2, serializer
+
+pytestmark = serializer
+
+
+def test_equal_signatures_share_serializer() -> None:
+    def first(a: int, b: str = "b") -> int:
+        return a
+
+    def second(a: int, b: str = "b") -> int:
+        return a
+
+    provider = Provider()
+    first_model = build_call_model(
+        first, dependency_provider=provider, serializer_cls=SerializerCls
+    )
+    second_model = build_call_model(
+        second, dependency_provider=Provider(), serializer_cls=SerializerCls
+    )
+
+    assert first_model.serializer.model is second_model.serializer.model
+    assert first_model.serializer.name == "first"
+    assert second_model.serializer.name == "second"
+    assert second_model.call(1) == 1
+
+
+def test_defaults_of_different_types_are_not_shared() -> None:
+    def first(a: int = 1) -> int:
+        return a
+
+    def second(a: int = True) -> int:
+        return a
+
+    provider = Provider()
+    first_model = build_call_model(
+        first, dependency_provider=provider, serializer_cls=SerializerCls
+    )
+    second_model = build_call_model(
+        second, dependency_provider=provider, serializer_cls=SerializerCls
+    )
+
+    assert first_model.serializer is not second_model.serializer
+
+
+def test_different_dependencies_are_not_shared() -> None:
+    def dep1() -> int:
+        return 1
+
+    def dep2() -> int:
+        return 2
+
+    def first(a: int = Depends(dep1)) -> int:
+        return a
+
+    def second(a: int = Depends(dep2)) -> int:
+        return a
+
+    provider = Provider()
+    first_model = build_call_model(
+        first, dependency_provider=provider, serializer_cls=SerializerCls
+    )
+    second_model = build_call_model(
+        second, dependency_provider=provider, serializer_cls=SerializerCls
+    )
+
+    assert first_model.serializer is not second_model.serializer
+
+
+def test_unhashable_default_is_not_shared() -> None:
+    def first(a: list[int] = [1]) -> list[int]:  # noqa: B006
+        return a
+
+    def second(a: list[int] = [1]) -> list[int]:  # noqa: B006
+        return a
+
+    provider = Provider()
+    first_model = build_call_model(
+        first, dependency_provider=provider, serializer_cls=SerializerCls
+    )
+    second_model = build_call_model(
+        second, dependency_provider=provider, serializer_cls=SerializerCls
+    )
+
+    assert first_model.serializer is not second_model.serializer
+
+
+@pydanticV2
+def test_shared_model_keeps_call_names() -> None:
+    from pydantic import ValidationError as PValidationError
+
+    from fast_depends.pydantic import PydanticSerializer
+    from fast_depends.pydantic.schema import get_schema
+
+    def handler_one(a: int) -> int:
+        return a
+
+    def handler_two(a: int) -> int:
+        return a
+
+    serializer_cls = PydanticSerializer(use_fastdepends_errors=False)
+    first_model = build_call_model(
+        handler_one, dependency_provider=Provider(), serializer_cls=serializer_cls
+    )
+    second_model = build_call_model(
+        handler_two, dependency_provider=Provider(), serializer_cls=serializer_cls
+    )
+
+    assert first_model.serializer.model is second_model.serializer.model
+    assert get_schema(first_model)["title"] == "handler_one"
+    assert get_schema(second_model)["title"] == "handler_two"
+
+    with pytest.raises(PValidationError, match="for handler_two"):
+        second_model.serializer({"a": "wrong"})
+
+    with pytest.raises(PValidationError, match="for handler_two"):
+        second_model.serializer.from_json(b'{"a": "wrong"}')
@@ -8,7 +8,8 @@ from unittest.mock import Mock
 
 import pytest
 
-from fast_depends import Depends, inject
+from fast_depends import Depends, Provider, inject
+from fast_depends.core import build_call_model
 from fast_depends.exceptions import ValidationError
 from tests.marks import serializer
 
@@ -452,3 +453,45 @@ def test_generator_iter() -> None:
 
     assert len(list(iterator)) == 13
     assert len(list(iterator)) == 0
+
+
+def test_teardown_is_tracked_through_subtree() -> None:
+    mock = Mock()
+
+    def gen() -> Generator[int, None, None]:
+        yield 1
+        mock.exit()
+
+    def dep(g: int = Depends(gen)) -> int:
+        return g
+
+    def plain() -> int:
+        return 1
+
+    @inject
+    def with_gen(d: int = Depends(dep)) -> int:
+        return d
+
+    @inject
+    def without_gen(d: int = Depends(plain)) -> int:
+        return d
+
+    assert with_gen() == 1
+    mock.exit.assert_called_once()
+
+    assert without_gen() == 1
+
+
+def test_generator_requires_stack() -> None:
+    def gen() -> Generator[int, None, None]:
+        yield 1
+
+    def func(g: int = Depends(gen)) -> int:
+        return g
+
+    model = build_call_model(func, dependency_provider=Provider())
+
+    assert model.solve(stack=None, cache_dependencies={}, g=1) == 1
+
+    with pytest.raises(AssertionError, match="requires an exit stack"):
+        model.solve(stack=None, cache_dependencies={})
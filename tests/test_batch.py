@@ -0,0 +1,167 @@
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import Mock, call
+
+import pytest
+
+from fast_depends import Depends, inject
+from fast_depends.exceptions import ValidationError
+from tests.marks import serializer
+
+
+def test_shared_dependency_solved_once() -> None:
+    mock = Mock()
+
+    def shared() -> int:
+        mock.shared()
+        return 10
+
+    def per_item(a: int) -> int:
+        mock.per_item()
+        return a * 2
+
+    @inject
+    def func(a: int, s: int = Depends(shared), d: int = Depends(per_item)) -> int:
+        return a + s + d
+
+    assert func.batch([{"a": 1}, {"a": 2}, {"a": 3}]) == [13, 16, 19]
+    mock.shared.assert_called_once()
+    assert mock.per_item.call_count == 3
+
+
+def test_dependency_consuming_other_results_is_not_shared() -> None:
+    def per_item(a: int) -> int:
+        return a
+
+    def derived(d: int) -> int:
+        return d + 1
+
+    @inject
+    def func(a: int, d: int = Depends(per_item), r: int = Depends(derived)) -> int:
+        return r
+
+    assert func.batch([{"a": 1}, {"a": 2}]) == [2, 3]
+
+
+def test_item_errors() -> None:
+    def dep(a: int) -> int:
+        if a == 2:
+            raise ValueError("dependency error")
+        return a
+
+    @inject
+    def func(a: int, d: int = Depends(dep)) -> int:
+        if a == 3:
+            raise KeyError("call error")
+        return d
+
+    result = func.batch([{"a": 1}, {"a": 2}, {"a": 3}])
+
+    assert result[0] == 1
+    assert isinstance(result[1], ValueError)
+    assert isinstance(result[2], KeyError)
+
+
+@serializer
+def test_batch_validation() -> None:
+    @inject
+    def func(a: int) -> float:
+        return a
+
+    result = func.batch([{"a": "1"}, {"a": "wrong"}, {"a": 3}])
+
+    assert result[0] == 1.0
+    assert isinstance(result[0], float)
+    assert isinstance(result[1], ValidationError)
+    assert result[2] == 3.0
+
+
+def test_call_extra() -> None:
+    @inject(b=2)
+    def func(a: int, b: int) -> int:
+        return a + b
+
+    assert func.batch([{"a": 1}, {"a": 2, "b": 0}]) == [3, 2]
+
+
+@pytest.mark.anyio
+async def test_async_batch() -> None:
+    mock = Mock()
+
+    async def shared() -> int:
+        mock()
+        return 10
+
+    @inject
+    async def func(a: int, s: int = Depends(shared)) -> int:
+        if a < 0:
+            raise ValueError("negative")
+        return a + s
+
+    result = await func.batch([{"a": 1}, {"a": -1}, {"a": 2}])
+
+    assert result[0] == 11
+    assert isinstance(result[1], ValueError)
+    assert result[2] == 12
+    mock.assert_called_once()
+
+
+def test_generator_per_item_teardown() -> None:
+    mock = Mock()
+
+    def session(a: int) -> Iterator[int]:
+        try:
+            yield a
+        except Exception:
+            mock.rollback(a)
+            raise
+        else:
+            mock.commit(a)
+
+    @inject
+    def func(a: int, s: int = Depends(session)) -> int:
+        mock.call(a)
+        if a == 2:
+            raise ValueError("call error")
+        return s
+
+    result = func.batch([{"a": 1}, {"a": 2}, {"a": 3}])
+
+    assert result[0] == 1
+    assert isinstance(result[1], ValueError)
+    assert result[2] == 3
+    assert mock.mock_calls == [
+        call.call(1),
+        call.call(2),
+        call.call(3),
+        call.commit(1),
+        call.rollback(2),
+        call.commit(3),
+    ]
+
+
+@pytest.mark.anyio
+async def test_async_generator_per_item_teardown() -> None:
+    mock = Mock()
+
+    async def session(a: int) -> AsyncIterator[int]:
+        try:
+            yield a
+        except Exception:
+            mock.rollback(a)
+            raise
+        else:
+            mock.commit(a)
+
+    @inject
+    async def func(a: int, s: int = Depends(session)) -> int:
+        if a == 2:
+            raise ValueError("call error")
+        return s
+
+    result = await func.batch([{"a": 1}, {"a": 2}, {"a": 3}])
+
+    assert result[0] == 1
+    assert isinstance(result[1], ValueError)
+    assert result[2] == 3
+    mock.commit.assert_has_calls([call(1), call(3)])
+    mock.rollback.assert_called_once_with(2)
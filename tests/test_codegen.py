@@ -0,0 +1,97 @@
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from fast_depends import Depends, inject
+from fast_depends.exceptions import ValidationError
+from tests.marks import serializer
+
+
+def dep(a: int) -> int:
+    return a * 2
+
+
+def extra(a: int) -> None:
+    pass
+
+
+def positional(a: int, b: str = "b") -> tuple[int, str]:
+    return a, b
+
+
+def keyword_only(a: int, *, b: str = "b") -> tuple[int, str]:
+    return a, b
+
+
+def with_dependency(a: int, c: int = Depends(dep)) -> tuple[int, int]:
+    return a, c
+
+
+def with_kw_dependency(*, c: int = Depends(dep), a: int) -> tuple[int, int]:
+    return a, c
+
+
+@pytest.mark.parametrize(
+    ("func", "args", "kwargs"),
+    (
+        pytest.param(positional, ("1",), {}, id="positional"),
+        pytest.param(positional, ("1", "2"), {}, id="positional all"),
+        pytest.param(positional, (), {"a": "1", "b": "2"}, id="positional as keywords"),
+        pytest.param(keyword_only, ("1", "2"), {}, id="keyword only by position"),
+        pytest.param(keyword_only, ("1",), {"b": "2"}, id="keyword only"),
+        pytest.param(with_dependency, ("1",), {}, id="dependency"),
+        pytest.param(with_dependency, ("1",), {"c": 5}, id="dependency passed"),
+        pytest.param(with_kw_dependency, (), {"a": 1}, id="keyword dependency"),
+    ),
+)
+@pytest.mark.parametrize("cast", (True, False))
+def test_generated_wrapper_behaves_the_same(
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    cast: bool,
+) -> None:
+    generated = inject(func, codegen=True, cast=cast)
+    assert hasattr(generated, "__fastdepends_source__")
+
+    assert generated(*args, **kwargs) == inject(func, cast=cast)(*args, **kwargs)
+
+
+@pytest.mark.anyio
+async def test_generated_async_wrapper() -> None:
+    async def async_dep(a: int) -> int:
+        return a * 2
+
+    async def func(a: int, c: int = Depends(async_dep)) -> tuple[int, int]:
+        return a, c
+
+    generated = inject(func, codegen=True, extra_dependencies=(Depends(extra),))
+    assert hasattr(generated, "__fastdepends_source__")
+
+    assert await generated("1") == (1, 2)
+
+
+def test_generated_wrapper_call_extra() -> None:
+    generated = inject(positional, codegen=True, b="extra")
+
+    assert generated("1") == (1, "extra")
+    assert generated("1", b="2") == (1, "2")
+
+
+@serializer
+def test_generated_wrapper_validation() -> None:
+    generated = inject(positional, codegen=True)
+
+    with pytest.raises(ValidationError):
+        generated("a")
+
+
+def test_unsupported_signature_fallback() -> None:
+    def func(*args, **kwargs):
+        return args, kwargs
+
+    generated = inject(func, codegen=True)
+    assert not hasattr(generated, "__fastdepends_source__")
+
+    assert generated("1", b="2") == (("1",), {"b": "2"})
@@ -0,0 +1,173 @@
+import pytest
+
+from fast_depends import Depends, inject
+from fast_depends.exceptions import ValidationError
+from tests.marks import msgspec, pydanticV2, serializer
+
+
+@serializer
+def test_validated_from_bytes() -> None:
+    @inject
+    def func(a: int, b: float = 1.0) -> float:
+        return a + b
+
+    assert func.from_json(b'{"a": "1", "b": 0.5}') == 1.5
+    assert func.from_json(b'{"a": 2}') == 3.0
+
+
+@serializer
+def test_validation_error() -> None:
+    @inject
+    def func(a: int) -> int:
+        return a
+
+    with pytest.raises(ValidationError):
+        func.from_json(b'{"a": "wrong"}')
+
+
+@serializer
+def test_with_dependencies() -> None:
+    def dep(b: int) -> int:
+        return b * 2
+
+    @inject
+    def func(a: int, d: int = Depends(dep)) -> int:
+        return a + d
+
+    assert func.from_json(b'{"a": "1", "b": "2"}') == 5
+
+
+@serializer
+def test_call_extra() -> None:
+    @inject(b=2)
+    def func(a: int, b: int) -> int:
+        return a + b
+
+    assert func.from_json(b'{"a": 1}') == 3
+    assert func.from_json(b'{"a": 1, "b": 0}') == 1
+
+
+@serializer
+@pytest.mark.parametrize("data", [b"[1]", b"1", b"{wrong"])
+def test_invalid_payload(data: bytes) -> None:
+    def dep(b: int) -> int:
+        return b
+
+    @inject
+    def flat(a: int) -> int:
+        return a
+
+    @inject
+    def with_dep(a: int, d: int = Depends(dep)) -> int:
+        return a + d
+
+    with pytest.raises(ValidationError):
+        flat.from_json(data)
+
+    with pytest.raises(ValidationError):
+        with_dep.from_json(data)
+
+
+@pydanticV2
+@pytest.mark.parametrize("data", [b"[1]", b"1", b"{wrong"])
+def test_invalid_payload_pydantic_errors(data: bytes) -> None:
+    from pydantic import ValidationError as PValidationError
+
+    from fast_depends.pydantic import PydanticSerializer
+
+    serializer_cls = PydanticSerializer(use_fastdepends_errors=False)
+
+    def dep(b: int) -> int:
+        return b
+
+    @inject(serializer_cls=serializer_cls)
+    def flat(a: int) -> int:
+        return a
+
+    @inject(serializer_cls=serializer_cls)
+    def with_dep(a: int, d: int = Depends(dep)) -> int:
+        return a + d
+
+    with pytest.raises(PValidationError):
+        flat.from_json(data)
+
+    with pytest.raises(PValidationError):
+        with_dep.from_json(data)
+
+
+@msgspec
+@pytest.mark.parametrize("data", [b"[1]", b"1", b"{wrong"])
+def test_invalid_payload_msgspec_errors(data: bytes) -> None:
+    from msgspec import DecodeError
+
+    from fast_depends.msgspec import MsgSpecSerializer
+
+    serializer_cls = MsgSpecSerializer(use_fastdepends_errors=False)
+
+    def dep(b: int) -> int:
+        return b
+
+    @inject(serializer_cls=serializer_cls)
+    def flat(a: int) -> int:
+        return a
+
+    @inject(serializer_cls=serializer_cls)
+    def with_dep(a: int, d: int = Depends(dep)) -> int:
+        return a + d
+
+    # `msgspec.ValidationError` is a `DecodeError` subclass
+    with pytest.raises(DecodeError):
+        flat.from_json(data)
+
+    with pytest.raises(DecodeError):
+        with_dep.from_json(data)
+
+
+@pytest.mark.parametrize("data", [b"[1]", b"{wrong"])
+def test_invalid_payload_without_serializer(data: bytes) -> None:
+    @inject(cast=False)
+    def func(a: int) -> int:
+        return a
+
+    with pytest.raises(ValidationError):
+        func.from_json(data)
+
+
+def test_without_serializer() -> None:
+    @inject(cast=False)
+    def func(a: int) -> int:
+        return a
+
+    assert func.from_json(b'{"a": "1"}') == "1"
+
+
+@serializer
+@pytest.mark.anyio
+async def test_async_from_json() -> None:
+    def dep(b: int) -> int:
+        return b
+
+    @inject
+    async def flat(a: int) -> int:
+        return a
+
+    @inject
+    async def with_dep(a: int, d: int = Depends(dep)) -> int:
+        return a + d
+
+    assert await flat.from_json(b'{"a": "1"}') == 1
+    assert await with_dep.from_json(b'{"a": "1", "b": 2}') == 3
+
+
+@serializer
+@pytest.mark.anyio
+async def test_async_invalid_payload() -> None:
+    def dep(b: int) -> int:
+        return b
+
+    @inject
+    async def with_dep(a: int, d: int = Depends(dep)) -> int:
+        return a + d
+
+    with pytest.raises(ValidationError):
+        await with_dep.from_json(b"[1]")
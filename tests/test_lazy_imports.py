@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+from fast_depends import inject
+from fast_depends.use import SerializerCls, get_default_serializer
+
+
+def test_import_defers_heavy_modules() -> None:
+    code = (
+        "import sys, fast_depends; "
+        "print(*(m for m in ('pydantic', 'msgspec', 'anyio', 'asyncio') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_default_serializer_is_resolved_on_build() -> None:
+    @inject
+    def func(a: int) -> int:
+        return a
+
+    assert SerializerCls is get_default_serializer()
+
+    if SerializerCls is not None:
+        assert func("1") == 1
@@ -0,0 +1,108 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from fast_depends import Depends, Provider, inject
+from fast_depends.library.serializer import LazySerializer, Serializer
+from fast_depends.use import SerializerCls
+from tests.marks import serializer
+
+pytestmark = serializer
+
+
+class CountingSerializer:
+    def __init__(self) -> None:
+        self.built = 0
+
+    def __call__(self, **kwargs: Any) -> Serializer:
+        self.built += 1
+        return SerializerCls(**kwargs)
+
+
+def test_built_on_first_call() -> None:
+    serializer_cls = CountingSerializer()
+
+    def dep(b: int) -> int:
+        return b
+
+    @inject(
+        serializer_cls=serializer_cls,
+        dependency_provider=Provider(),
+        lazy_serializer=True,
+    )
+    def func(a: int, d: int = Depends(dep)) -> int:
+        return a + d
+
+    assert serializer_cls.built == 0
+
+    assert func("1", b="2") == 3
+    assert serializer_cls.built == 2
+
+    assert func("1", b="2") == 3
+    assert serializer_cls.built == 2
+
+
+def test_variadic_arguments_built_on_first_call() -> None:
+    serializer_cls = CountingSerializer()
+
+    @inject(
+        serializer_cls=serializer_cls,
+        dependency_provider=Provider(),
+        lazy_serializer=True,
+    )
+    def func(x: int, *args: Any, **kwargs: Any) -> int:
+        return x + len(args) + len(kwargs)
+
+    assert serializer_cls.built == 0
+
+    assert func("1", 2, y=3) == 3
+    assert serializer_cls.built == 1
+
+
+def test_warmup() -> None:
+    serializer_cls = CountingSerializer()
+
+    def dep(b: int) -> int:
+        return b
+
+    @inject(
+        serializer_cls=serializer_cls,
+        dependency_provider=Provider(),
+        lazy_serializer=True,
+    )
+    def func(a: int, d: int = Depends(dep)) -> int:
+        return a + d
+
+    func.warmup()
+    assert serializer_cls.built == 2
+
+    assert func("1", b="2") == 3
+    assert serializer_cls.built == 2
+
+
+def test_built_once_by_concurrent_threads() -> None:
+    mock = Mock()
+
+    def factory() -> Serializer:
+        mock()
+        time.sleep(0.01)
+        return SerializerCls(name="func", options=[], response_type=int)
+
+    lazy = LazySerializer(factory, name="func", options=[], response_type=int)
+
+    with ThreadPoolExecutor(4) as executor:
+        assert list(executor.map(lazy.response, ("1", "2", "3", "4"))) == [1, 2, 3, 4]
+
+    mock.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_async_lazy_serializer() -> None:
+    @inject(lazy_serializer=True)
+    async def func(a: int) -> int:
+        return a
+
+    assert await func("1") == 1
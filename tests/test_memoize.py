@@ -0,0 +1,128 @@
+from unittest.mock import Mock
+
+import pytest
+
+from fast_depends import Depends, Provider, inject
+from fast_depends.dependencies import Memoize
+from fast_depends.dependencies.memo import MemoCache
+
+
+def test_sync_memoize(provider: Provider) -> None:
+    mock = Mock()
+
+    def dep(a: int) -> int:
+        mock(a)
+        return a * 2
+
+    @inject(dependency_provider=provider)
+    def func(a: int, d: int = Depends(dep, memoize=True)) -> int:
+        return d
+
+    assert func(1) == 2
+    assert func("1") == 2
+    assert func(2) == 4
+
+    assert mock.call_count == 2
+
+    info = provider.memo_info(dep)
+    assert info is not None
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+@pytest.mark.anyio
+async def test_async_memoize(provider: Provider) -> None:
+    mock = Mock()
+
+    async def dep(a: int) -> int:
+        mock(a)
+        return a * 2
+
+    @inject(dependency_provider=provider)
+    async def func(a: int, d: int = Depends(dep, memoize=True)) -> int:
+        return d
+
+    assert await func(1) == 2
+    assert await func(1) == 2
+
+    mock.assert_called_once_with(1)
+
+
+def test_memoize_unhashable_arguments(provider: Provider) -> None:
+    mock = Mock()
+
+    def dep(a: list[int]) -> int:
+        mock()
+        return len(a)
+
+    @inject(dependency_provider=provider)
+    def func(a: list[int], d: int = Depends(dep, memoize=True)) -> int:
+        return d
+
+    assert func([1]) == 1
+    assert func([1]) == 1
+
+    assert mock.call_count == 2
+
+
+def test_memoize_closed_with_provider(provider: Provider) -> None:
+    def dep() -> int:
+        return 1
+
+    @inject(dependency_provider=provider)
+    def func(d: int = Depends(dep, memoize=True)) -> int:
+        return d
+
+    func()
+    assert provider.memo_info(dep) is not None
+
+    provider.close()
+    assert provider.memo_info(dep) is None
+
+
+def test_memoize_generator() -> None:
+    def dep():
+        yield 1
+
+    with pytest.raises(AssertionError, match="memoize generator"):
+
+        @inject
+        def func(d: int = Depends(dep, memoize=True)) -> int:
+            return d
+
+
+def test_lru_eviction() -> None:
+    cache = MemoCache(Memoize(maxsize=2))
+
+    cache.set(1, "a")
+    cache.set(2, "b")
+    assert cache.get(1) == "a"
+    cache.set(3, "c")
+
+    assert cache.get(2) is cache.get(4)  # both are missing
+    assert cache.get(1) == "a"
+    assert cache.get(3) == "c"
+    assert cache.info().evictions == 1
+
+
+def test_ttl_eviction() -> None:
+    cache = MemoCache(Memoize(ttl=-1))
+
+    cache.set(1, "a")
+
+    assert cache.get(1) is cache.get(2)
+    assert cache.info().evictions == 1
+    assert cache.info().currsize == 0
+
+
+def test_weight_eviction() -> None:
+    cache = MemoCache(Memoize(maxsize=None, max_weight=5, weigher=len))
+
+    cache.set(1, "aa")
+    cache.set(2, "bbb")
+    assert cache.info().weight == 5
+
+    cache.set(3, "c")
+
+    assert cache.info().currsize == 2
+    assert cache.info().weight == 4
+    assert cache.info().evictions == 1
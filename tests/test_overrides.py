@@ -2,6 +2,7 @@ from collections.abc import AsyncGenerator, Generator
 from typing import Annotated
 from unittest.mock import Mock
 
+import anyio
 import pytest
 
 from fast_depends import Depends, Provider, inject
@@ -305,3 +306,206 @@ def test_clear_overrides(provider: Provider) -> None:
     assert len(provider.overrides) == 0
     assert len(provider.dependencies) == 1
     assert func() == 1  # original dep called
+
+
+def test_override_cache_does_not_collide_with_original(provider: Provider) -> None:
+    mock = Mock()
+
+    def base_dep() -> int:
+        return 1
+
+    def override_dep() -> int:
+        mock()
+        return 2
+
+    provider.override(base_dep, override_dep)
+
+    @inject(dependency_provider=provider)
+    def func(
+        a: int = Depends(base_dep),
+        b: int = Depends(base_dep),
+        c: int = Depends(override_dep),
+    ) -> tuple[int, int, int]:
+        return a, b, c
+
+    assert func() == (2, 2, 2)
+    # override result is shared between the same overridden dependency only
+    assert mock.call_count == 2
+
+
+def test_generator_override_without_teardown(provider: Provider) -> None:
+    mock = Mock()
+
+    def base_dep() -> int:
+        return 1
+
+    def override_dep() -> Generator[int, None, None]:
+        yield 2
+        mock.exit()
+
+    @inject(dependency_provider=provider)
+    def func(d: int = Depends(base_dep)) -> int:
+        return d
+
+    provider.override(base_dep, override_dep)
+
+    assert func() == 2
+    mock.exit.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_async_generator_override_without_teardown(provider: Provider) -> None:
+    mock = Mock()
+
+    async def base_dep() -> int:
+        return 1
+
+    async def override_dep() -> AsyncGenerator[int, None]:
+        yield 2
+        mock.exit()
+
+    @inject(dependency_provider=provider)
+    async def func(d: int = Depends(base_dep)) -> int:
+        return d
+
+    provider.override(base_dep, override_dep)
+
+    assert await func() == 2
+    mock.exit.assert_called_once()
+
+
+def test_local_scope(provider: Provider) -> None:
+    def base_dep() -> int:
+        return 1
+
+    def override_dep() -> int:
+        return 2
+
+    @inject(dependency_provider=provider)
+    def func(d: int = Depends(base_dep)) -> int:
+        return d
+
+    assert func() == 1
+
+    with provider.local_scope(base_dep, override_dep):
+        assert func() == 2
+        assert not provider.overrides
+
+    assert func() == 1
+
+
+def test_nested_local_scope(provider: Provider) -> None:
+    def base_dep() -> int:
+        return 1
+
+    def another_dep() -> int:
+        return 10
+
+    @inject(dependency_provider=provider)
+    def func(a: int = Depends(base_dep), b: int = Depends(another_dep)) -> int:
+        return a + b
+
+    with provider.local_scope(base_dep, lambda: 2):
+        with provider.local_scope(another_dep, lambda: 20):
+            assert func() == 22
+        assert func() == 12
+
+    assert func() == 11
+
+
+def test_local_scope_reuses_override_model(provider: Provider) -> None:
+    def base_dep() -> int:
+        return 1
+
+    def override_dep() -> int:
+        return 2
+
+    models = []
+    for _ in range(3):
+        with provider.local_scope(base_dep, override_dep):
+            models.append(provider.get_dependant(base_dep))
+
+    assert models[0].call is override_dep
+    assert models[0] is models[1] is models[2]
+
+    provider.override(base_dep, override_dep)
+    assert provider.get_dependant(base_dep) is models[0]
+
+
+def test_local_scope_generator_teardown(provider: Provider) -> None:
+    mock = Mock()
+
+    def base_dep() -> int:
+        return 1
+
+    def override_dep() -> Generator[int, None, None]:
+        yield 2
+        mock.exit()
+
+    @inject(dependency_provider=provider)
+    def func(d: int = Depends(base_dep)) -> int:
+        return d
+
+    with provider.local_scope(base_dep, override_dep):
+        assert func() == 2
+
+    mock.exit.assert_called_once()
+
+
+def test_local_scope_over_global_override(provider: Provider) -> None:
+    def base_dep() -> int:
+        return 1
+
+    @inject(dependency_provider=provider)
+    def func(d: int = Depends(base_dep)) -> int:
+        return d
+
+    provider.override(base_dep, lambda: 2)
+    with provider.local_scope(base_dep, lambda: 3):
+        assert func() == 3
+    assert func() == 2
+
+
+def test_local_scope_merged_provider(provider: Provider) -> None:
+    def base_dep() -> int:
+        return 1
+
+    def override_dep() -> int:
+        return 2
+
+    @inject(dependency_provider=provider)
+    def func(d: int = Depends(base_dep)) -> int:
+        return d
+
+    merged = provider.merge(Provider())
+    with provider.local_scope(base_dep, override_dep):
+        assert merged.get_dependant(base_dep).call is override_dep
+
+    assert merged.get_dependant(base_dep).call is base_dep
+
+
+@pytest.mark.anyio
+async def test_local_scope_is_task_local(provider: Provider) -> None:
+    async def base_dep() -> int:
+        return 0
+
+    @inject(dependency_provider=provider)
+    async def func(d: int = Depends(base_dep)) -> int:
+        await anyio.sleep(0.01)
+        return d
+
+    results: dict[int, int] = {}
+
+    async def run(value: int) -> None:
+        async def override_dep() -> int:
+            return value
+
+        with provider.local_scope(base_dep, override_dep):
+            results[value] = await func()
+
+    async with anyio.create_task_group() as tg:
+        for i in range(1, 5):
+            tg.start_soon(run, i)
+
+    assert results == {1: 1, 2: 2, 3: 3, 4: 4}
+    assert await func() == 0
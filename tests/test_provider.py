@@ -1,4 +1,6 @@
+import gc
 from contextlib import AsyncExitStack, ExitStack
+from weakref import WeakSet
 
 import pytest
 
@@ -42,6 +44,73 @@ def test_merge_keeps_both_sides() -> None:
     assert not original.overrides
 
 
+def test_merge_is_cached() -> None:
+    original, extra = Provider(), Provider()
+
+    assert original.merge(extra) is original.merge(extra)
+    assert original.merge(extra) is not extra.merge(original)
+
+
+def test_merged_view_dies_with_overlay() -> None:
+    original = Provider()
+    model = build_call_model(sync_func, dependency_provider=original)
+
+    overlays: WeakSet[Provider] = WeakSet()
+    for _ in range(10):
+        extra = Provider()
+        extra.override(base_dep, override_dep)
+        overlays.add(extra)
+        with ExitStack() as stack:
+            assert (
+                model.solve(
+                    stack=stack,
+                    cache_dependencies={},
+                    dependency_provider=extra,
+                )
+                == 2
+            )
+    del extra
+
+    # models keep the dependencies resolved by the last provider only
+    with ExitStack() as stack:
+        assert model.solve(stack=stack, cache_dependencies={}) == 1
+
+    gc.collect()
+    assert not overlays
+    assert not original._views
+
+
+def test_merge_follows_changes() -> None:
+    original, extra = Provider(), Provider()
+    original.add_dependant(build_call_model(sync_func, dependency_provider=original))
+
+    merged = original.merge(extra)
+    assert merged.get_dependant(base_dep).call is base_dep
+
+    extra.override(base_dep, override_dep)
+    assert merged.get_dependant(base_dep).call is override_dep
+
+    extra.clear()
+    assert merged.get_dependant(base_dep).call is base_dep
+
+    with original.scope(base_dep, override_dep):
+        assert merged.get_dependant(base_dep).call is override_dep
+    assert merged.get_dependant(base_dep).call is base_dep
+
+
+def test_merged_view_changes_do_not_leak() -> None:
+    original, extra = Provider(), Provider()
+
+    merged = original.merge(extra)
+    merged.override(base_dep, override_dep)
+
+    assert merged.get_dependant(base_dep).call is override_dep
+    assert not original.dependencies
+    assert not original.overrides
+    assert not extra.dependencies
+    assert not extra.overrides
+
+
 def test_sync_call_level_provider() -> None:
     provider = Provider()
     model = build_call_model(sync_func, dependency_provider=provider)
@@ -84,3 +153,174 @@ async def test_async_call_level_provider() -> None:
 
     async with AsyncExitStack() as stack:
         assert await model.asolve(stack=stack, cache_dependencies={}) == 1
+
+
+def nested_dep(d: int = Depends(base_dep)) -> int:
+    return d
+
+
+def test_build_cache_reuses_dependency_model() -> None:
+    provider = Provider()
+
+    def first(d: int = Depends(nested_dep)) -> int:
+        return d
+
+    def second(d: int = Depends(nested_dep)) -> int:
+        return d
+
+    build_call_model(first, dependency_provider=provider)
+    dep_model = provider.dependencies[nested_dep]
+    build_call_model(second, dependency_provider=provider)
+
+    assert provider.dependencies[nested_dep] is dep_model
+
+
+def test_build_cache_respects_options() -> None:
+    provider = Provider()
+
+    def first(d: int = Depends(nested_dep)) -> int:
+        return d
+
+    def second(d: int = Depends(nested_dep, use_cache=False)) -> int:
+        return d
+
+    build_call_model(first, dependency_provider=provider)
+    first_dep = provider.dependencies[nested_dep]
+    build_call_model(second, dependency_provider=provider)
+
+    assert provider.dependencies[nested_dep] is not first_dep
+    assert not provider.dependencies[nested_dep].use_cache
+
+    build_call_model(first, dependency_provider=provider)
+    # cache hit registers the cached model back
+    assert provider.dependencies[nested_dep] is first_dep
+
+
+def test_build_cache_replays_subtree() -> None:
+    provider = Provider()
+
+    def first(d: int = Depends(nested_dep)) -> int:
+        return d
+
+    def second(d: int = Depends(base_dep, use_cache=False)) -> int:
+        return d
+
+    build_call_model(first, dependency_provider=provider)
+    base_model = provider.dependencies[base_dep]
+    build_call_model(second, dependency_provider=provider)
+    assert provider.dependencies[base_dep] is not base_model
+
+    build_call_model(first, dependency_provider=provider)
+    assert provider.dependencies[base_dep] is base_model
+
+
+def test_build_cache_invalidated_on_override() -> None:
+    provider = Provider()
+    build_call_model(sync_func, dependency_provider=provider)
+    assert provider.build_cache
+
+    provider.override(base_dep, override_dep)
+    assert not provider.build_cache
+
+    build_call_model(sync_func, dependency_provider=provider)
+    assert provider.build_cache
+
+    provider.clear()
+    assert not provider.build_cache
+
+
+def test_override_models_dropped_on_clear() -> None:
+    provider = Provider()
+
+    provider.override(base_dep, override_dep)
+    (override_model,) = provider.overrides.values()
+
+    provider.override(base_dep, override_dep)
+    (reused_model,) = provider.overrides.values()
+    assert reused_model is override_model
+
+    provider.clear()
+    assert not provider._override_models
+
+    provider.override(base_dep, override_dep)
+    (rebuilt_model,) = provider.overrides.values()
+    assert rebuilt_model is not override_model
+
+
+def test_build_cache_invalidated_on_scope_exit() -> None:
+    provider = Provider()
+
+    with provider.scope(base_dep, override_dep):
+        model = build_call_model(sync_func, dependency_provider=provider)
+        with ExitStack() as stack:
+            assert model.solve(stack=stack, cache_dependencies={}) == 2
+        assert provider.build_cache
+
+    assert not provider.build_cache
+    with ExitStack() as stack:
+        assert model.solve(stack=stack, cache_dependencies={}) == 1
+
+
+def test_epoch_is_bumped_by_changes() -> None:
+    provider = Provider()
+    epochs = [provider.epoch]
+
+    provider.add_dependant(build_call_model(base_dep, dependency_provider=provider))
+    epochs.append(provider.epoch)
+
+    provider.override(base_dep, override_dep)
+    epochs.append(provider.epoch)
+
+    provider.clear()
+    epochs.append(provider.epoch)
+
+    with provider.scope(base_dep, override_dep):
+        epochs.append(provider.epoch)
+    epochs.append(provider.epoch)
+
+    assert epochs == sorted(set(epochs))
+
+
+def test_merged_epoch_follows_both_sides() -> None:
+    original, extra = Provider(), Provider()
+    merged = original.merge(extra)
+
+    epoch = merged.epoch
+    original.override(base_dep, override_dep)
+    assert merged.epoch > epoch
+
+    epoch = merged.epoch
+    extra.clear()
+    assert merged.epoch > epoch
+
+
+def test_model_resolves_dependencies_again_on_override() -> None:
+    provider = Provider()
+    model = build_call_model(sync_func, dependency_provider=provider)
+
+    with ExitStack() as stack:
+        assert model.solve(stack=stack, cache_dependencies={}) == 1
+
+    provider.override(base_dep, override_dep)
+    with ExitStack() as stack:
+        assert model.solve(stack=stack, cache_dependencies={}) == 2
+
+    provider.clear()
+    with ExitStack() as stack:
+        assert model.solve(stack=stack, cache_dependencies={}) == 1
+
+
+@pytest.mark.anyio
+async def test_async_model_resolves_dependencies_again_on_override() -> None:
+    provider = Provider()
+    model = build_call_model(async_func, dependency_provider=provider)
+
+    async with AsyncExitStack() as stack:
+        assert await model.asolve(stack=stack, cache_dependencies={}) == 1
+
+    with provider.scope(base_dep, override_dep):
+        async with AsyncExitStack() as stack:
+            assert await model.asolve(stack=stack, cache_dependencies={}) == 2
+
+    async with AsyncExitStack() as stack:
+        assert await model.asolve(stack=stack, cache_dependencies={}) == 1
@@ -0,0 +1,242 @@
+import threading
+from collections.abc import AsyncGenerator, Generator
+from unittest.mock import Mock
+
+import anyio
+import pytest
+
+from fast_depends import Depends, Provider, inject
+
+
+def test_sync_app_scope(provider: Provider) -> None:
+    mock = Mock()
+
+    def resource() -> Generator[int, None, None]:
+        mock.enter()
+        yield 1
+        mock.exit()
+
+    @inject(dependency_provider=provider)
+    def func(r: int = Depends(resource, scope="app")) -> int:
+        return r
+
+    assert func() == 1
+    assert func() == 1
+
+    mock.enter.assert_called_once()
+    assert not mock.exit.called
+
+    provider.close()
+    mock.exit.assert_called_once()
+
+    assert func() == 1
+    assert mock.enter.call_count == 2
+
+    provider.close()
+
+
+@pytest.mark.anyio
+async def test_async_app_scope(provider: Provider) -> None:
+    mock = Mock()
+
+    async def resource() -> AsyncGenerator[int, None]:
+        mock.enter()
+        await anyio.sleep(0.01)
+        yield 1
+        mock.exit()
+
+    @inject(dependency_provider=provider)
+    async def func(r: int = Depends(resource, scope="app")) -> int:
+        return r
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(func)
+
+    assert await func() == 1
+
+    mock.enter.assert_called_once()
+    assert not mock.exit.called
+
+    await provider.aclose()
+    mock.exit.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_async_app_scope_error_is_not_stored(provider: Provider) -> None:
+    mock = Mock(side_effect=[ValueError(), 1])
+
+    async def resource() -> int:
+        return mock()
+
+    @inject(dependency_provider=provider)
+    async def func(r: int = Depends(resource, scope="app")) -> int:
+        return r
+
+    with pytest.raises(ValueError):
+        await func()
+
+    assert await func() == 1
+    assert await func() == 1
+    assert mock.call_count == 2
+
+
+def test_app_scope_override_keeps_scope(provider: Provider) -> None:
+    mock = Mock()
+
+    def resource() -> int:
+        raise NotImplementedError
+
+    def override_resource() -> int:
+        mock()
+        return 2
+
+    @inject(dependency_provider=provider)
+    def func(r: int = Depends(resource, scope="app")) -> int:
+        return r
+
+    with provider.scope(resource, override_resource):
+        assert func() == 2
+        assert func() == 2
+
+    mock.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_async_app_scope_owner_cancel_is_not_shared(provider: Provider) -> None:
+    mock = Mock()
+    started = anyio.Event()
+
+    async def resource() -> int:
+        mock()
+        if mock.call_count == 1:
+            started.set()
+            await anyio.sleep_forever()
+        return 1
+
+    @inject(dependency_provider=provider)
+    async def func(r: int = Depends(resource, scope="app")) -> int:
+        return r
+
+    owner_scope = anyio.CancelScope()
+    results = []
+
+    async def owner() -> None:
+        with owner_scope:
+            await func()
+
+    async def waiter() -> None:
+        results.append(await func())
+
+    with anyio.fail_after(1):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(owner)
+            await started.wait()
+            tg.start_soon(waiter)
+            await anyio.sleep(0.01)
+            owner_scope.cancel()
+
+    # the waiter creates the value itself instead of failing with the cancellation
+    assert results == [1]
+    assert mock.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_sync_app_scope_waits_for_async_call(provider: Provider) -> None:
+    mock = Mock()
+    release = threading.Event()
+
+    def resource() -> int:
+        mock()
+        release.wait(1)
+        return 1
+
+    @inject(dependency_provider=provider)
+    async def async_func(r: int = Depends(resource, scope="app")) -> int:
+        return r
+
+    @inject(dependency_provider=provider)
+    def sync_func(r: int = Depends(resource, scope="app")) -> int:
+        return r
+
+    results = []
+
+    async def run_sync() -> None:
+        # waits for the value created by the async call
+        results.append(await anyio.to_thread.run_sync(sync_func))
+
+    with anyio.fail_after(2):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(async_func)
+            await anyio.sleep(0.01)
+            tg.start_soon(run_sync)
+            await anyio.sleep(0.05)
+            release.set()
+
+    assert results == [1]
+    mock.assert_called_once()
+
+    await provider.aclose()
+
+
+@pytest.mark.anyio
+async def test_async_app_scope_waits_for_sync_call(provider: Provider) -> None:
+    mock = Mock()
+    release = threading.Event()
+
+    def pool() -> Generator[int, None, None]:
+        mock.enter()
+        release.wait(1)
+        yield 1
+        mock.exit()
+
+    @inject(dependency_provider=provider)
+    def sync_func(p: int = Depends(pool, scope="app")) -> int:
+        return p
+
+    @inject(dependency_provider=provider)
+    async def async_func(p: int = Depends(pool, scope="app")) -> int:
+        return p
+
+    results = []
+
+    async def run_sync() -> None:
+        results.append(await anyio.to_thread.run_sync(sync_func))
+
+    async def run_async() -> None:
+        # waits for the value created by the sync call
+        results.append(await async_func())
+
+    with anyio.fail_after(2):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(run_sync)
+            await anyio.sleep(0.01)
+            tg.start_soon(run_async)
+            await anyio.sleep(0.05)
+            release.set()
+
+    assert results == [1, 1]
+    mock.enter.assert_called_once()
+
+    await provider.aclose()
+    mock.exit.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_close_warns_about_async_teardowns(provider: Provider) -> None:
+    mock = Mock()
+
+    async def resource() -> AsyncGenerator[int, None]:
+        yield 1
+        mock.exit()
+
+    @inject(dependency_provider=provider)
+    async def func(r: int = Depends(resource, scope="app")) -> int:
+        return r
+
+    await func()
+
+    with pytest.warns(RuntimeWarning, match="aclose"):
+        provider.close()
+
+    assert not mock.exit.called
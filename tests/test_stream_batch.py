@@ -0,0 +1,67 @@
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from fast_depends import inject
+from fast_depends.exceptions import ValidationError
+from fast_depends.utils import async_batch_map, batch_map
+from tests.marks import serializer
+
+
+def test_batch_map() -> None:
+    chunks: list[list[int]] = []
+
+    def func(chunk: list[int]) -> list[int]:
+        chunks.append(chunk)
+        return [i * 2 for i in chunk]
+
+    assert list(batch_map(func, range(5), 2)) == [0, 2, 4, 6, 8]
+    assert chunks == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.anyio
+async def test_async_batch_map() -> None:
+    chunks: list[list[int]] = []
+
+    def func(chunk: list[int]) -> list[int]:
+        chunks.append(chunk)
+        return chunk
+
+    async def gen() -> AsyncIterator[int]:
+        for i in range(4):
+            yield i
+
+    assert [i async for i in async_batch_map(func, gen(), 2)] == [0, 1, 2, 3]
+    assert chunks == [[0, 1], [2, 3]]
+
+
+@serializer
+def test_sync_generator_stream() -> None:
+    @inject(stream_batch_size=2)
+    def func(n: int) -> Iterator[int]:
+        for i in range(n):
+            yield str(i)
+
+    assert list(func("5")) == [0, 1, 2, 3, 4]
+
+
+@serializer
+@pytest.mark.anyio
+async def test_async_generator_stream() -> None:
+    @inject(stream_batch_size=2)
+    async def func(n: int) -> AsyncIterator[int]:
+        for i in range(n):
+            yield str(i)
+
+    assert [i async for i in func("5")] == [0, 1, 2, 3, 4]
+
+
+@serializer
+def test_stream_validation_error() -> None:
+    @inject(stream_batch_size=10)
+    def func() -> Iterator[int]:
+        yield 1
+        yield "not-an-int"
+
+    with pytest.raises(ValidationError):
+        list(func())
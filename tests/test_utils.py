@@ -1,6 +1,14 @@
+from typing import Annotated, ForwardRef
 from unittest.mock import AsyncMock
 
-from fast_depends.utils import is_coroutine_callable
+import pytest
+
+from fast_depends import utils
+from fast_depends.utils import (
+    get_typed_signature,
+    has_forward_refs,
+    is_coroutine_callable,
+)
 
 
 def test_is_coroutine_callable() -> None:
@@ -13,3 +21,38 @@ def test_is_coroutine_callable() -> None:
     assert not is_coroutine_callable(sync_func)
 
     assert is_coroutine_callable(AsyncMock())
+
+
+def test_has_forward_refs() -> None:
+    assert has_forward_refs("int")
+    assert has_forward_refs(ForwardRef("int"))
+    assert has_forward_refs(Annotated["int", "meta"])
+    assert not has_forward_refs(int)
+    assert not has_forward_refs(Annotated[int, 1])
+
+
+def test_stack_is_not_walked_without_forward_refs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def collect() -> dict[str, object]:
+        raise AssertionError("stack should not be walked")
+
+    monkeypatch.setattr(utils, "collect_outer_stack_locals", collect)
+
+    def func(a: int, b: Annotated[str, 1]) -> float: ...
+
+    signature, return_annotation = get_typed_signature(func)
+
+    assert signature.parameters["a"].annotation is int
+    assert return_annotation is float
+
+
+def test_forward_refs_resolved_from_stack() -> None:
+    class LocalModel: ...
+
+    def func(a: "LocalModel") -> "LocalModel": ...
+
+    signature, return_annotation = get_typed_signature(func)
+
+    assert signature.parameters["a"].annotation is LocalModel
+    assert return_annotation is LocalModel